@@ -8,7 +8,15 @@ class BaseEnum(Enum):
         has issues when classes are imported from two different locations
 
         As such we define equality to work on a string comparison instead.
+        Members are singletons, so the usual case of comparing with the very
+        same member is answered first, without looking at any names.
         """
+        if self is __value:
+            return True
         if self.__class__.__name__ == __value.__class__.__name__:
             return self.value == __value.value
         return False
+
+    # Defining __eq__ removes the inherited __hash__. Enum hashes on the member name,
+    # which agrees with the equality above, even across the two import locations.
+    __hash__ = Enum.__hash__
@@ -0,0 +1,284 @@
+"""
+Batch battle engine. Simulates many independent battles in lockstep.
+"""
+from __future__ import annotations
+from array import array
+
+from battle import Battle
+from elements import EffectivenessCalculator
+from monster_base import MonsterBase
+from team import MonsterTeam
+
+from data_structures.referential_array import ArrayR
+
+
+class BatchBattle:
+    """
+    Simulates N battles at once, producing exactly the Battle.Result values that
+    running Battle.battle on each pair of teams would.
+
+    Every turn is split into phases (choose actions, swap, attack, resolve) and each
+    phase is a single pass over all unfinished battles. The state of the monsters
+    currently out lives in flat columns indexed by `2 * battle + side`: HP, speed and
+    the damage each one deals to its opponent. Choosing actions with the stock
+    MonsterTeam.choose_action, attacking, the end of turn HP loss and the faint checks
+    are plain arithmetic on those columns, without calling into the monsters.
+
+    Monster objects are only used when something actually changes: swaps and specials,
+    level ups, evolutions and retrieving a replacement. Their HP is written back from
+    the column right before any such call, and at the end of the battle.
+
+    Monsters that override attack, alive, get_hp or set_hp cannot be simulated on the
+    columns, so turns involving them go through Battle's own phases instead.
+    Within one call, the stats of a monster are assumed to only depend on its type,
+    mode and level, so they are computed once for each of those.
+
+    Usage:
+    ```
+    results = BatchBattle().battle_all(teams1, teams2)
+    ```
+    """
+
+    ATTACK = Battle.Action.ATTACK.value
+    SWAP = Battle.Action.SWAP.value
+    SPECIAL = Battle.Action.SPECIAL.value
+
+    def battle_all(self, teams1: ArrayR[MonsterTeam], teams2: ArrayR[MonsterTeam]) -> ArrayR[Battle.Result]:
+        """
+        Battle teams1[i] against teams2[i] for every i.
+
+        :complexity: O(T * N) where T is the length of the longest battle and N the number of battles.
+        """
+        n = len(teams1)
+        if len(teams2) != n:
+            raise ValueError("teams1 and teams2 must have the same length.")
+        self.teams = ArrayR(2 * n)
+        self.out = ArrayR(2 * n)
+        self.results = ArrayR(n)
+        # Id of the (type, mode, level) of the monster out, -1 before it is loaded.
+        self.stat_id = array("l", [-1]) * (2 * n)
+        self.hp = array("d", bytes(16 * n))
+        self.hp_is_int = array("b", bytes(2 * n))
+        self.speed = array("d", bytes(16 * n))
+        self.damage = array("d", bytes(16 * n))
+        self.ready = array("b", bytes(2 * n))
+        self.plain = array("b", bytes(2 * n))
+        self.stock_policy = array("b", bytes(2 * n))
+        self.actions = array("b", bytes(2 * n))
+        # (attack, defense, speed, element value) for each stats id.
+        self._stat_ids = {}
+        self._stat_values = []
+        self._damage_cache = {}
+        self._plain_classes = {}
+        # Used to run Battle's phases for turns that cannot be done on the columns.
+        self._fallback = Battle(verbosity=0)
+
+        for i in range(n):
+            for k, team in ((2 * i, teams1[i]), (2 * i + 1, teams2[i])):
+                self.teams[k] = team
+                self.stock_policy[k] = type(team).choose_action is MonsterTeam.choose_action and "choose_action" not in vars(team)
+                self.out[k] = team.retrieve_from_team()
+            self._load(2 * i)
+            self._load(2 * i + 1)
+
+        active = array("l", range(n))
+        while len(active) > 0:
+            self._choose_actions(active)
+            self._change_out(active)
+            self._attack(active)
+            active = self._resolve(active)
+        return self.results
+
+    def _is_plain(self, monster_class: type) -> bool:
+        """Whether the columns can stand in for this class's HP and attacks."""
+        plain = self._plain_classes.get(monster_class)
+        if plain is None:
+            plain = monster_class.has_plain_combat()
+            self._plain_classes[monster_class] = plain
+        return plain
+
+    def _load(self, k: int) -> None:
+        """Fill column k from the monster out, and the damage between it and its opponent."""
+        # The ctypes arrays behind the ArrayRs are indexed directly, this runs on every change of monster.
+        monster = self.out.array[k]
+        monster_class = type(monster)
+        plain = self._plain_classes.get(monster_class)
+        if plain is None:
+            plain = self._is_plain(monster_class)
+        self.plain[k] = plain
+        # Each distinct (type, mode, level) gets a small id, so pairs of them hash cheaply.
+        key = (monster_class, monster.simple_mode, monster.get_level())
+        stat_id = self._stat_ids.get(key)
+        if stat_id is None:
+            stat_id = len(self._stat_ids)
+            self._stat_ids[key] = stat_id
+            self._stat_values.append((monster.get_attack(), monster.get_defense(), monster.get_speed(), monster.get_element_type().value))
+        self.stat_id[k] = stat_id
+        self.speed[k] = self._stat_values[stat_id][2]
+        self.ready[k] = monster.ready_to_evolve()
+        hp = monster.get_hp()
+        self.hp[k] = hp
+        self.hp_is_int[k] = type(hp) is int
+        other = k ^ 1
+        other_id = self.stat_id[other]
+        if other_id >= 0:
+            self.damage[k] = self._damage(stat_id, other_id)
+            self.damage[other] = self._damage(other_id, stat_id)
+
+    def _damage(self, attacker: int, defender: int) -> int:
+        """Damage between the stats with the given ids."""
+        damage = self._damage_cache.get((attacker, defender))
+        if damage is None:
+            attacker_stats = self._stat_values[attacker]
+            defender_stats = self._stat_values[defender]
+            multiplier = EffectivenessCalculator.instance.table[
+                (attacker_stats[3] - 1) * EffectivenessCalculator.N_ELEMENTS + defender_stats[3] - 1
+            ]
+            damage = MonsterBase.compute_damage(attacker_stats[0], defender_stats[1], multiplier)
+            self._damage_cache[(attacker, defender)] = damage
+        return damage
+
+    def _write_hp(self, k: int) -> None:
+        """Bring the HP of the monster out at column k up to date, before it is used as an object."""
+        if self.plain[k]:
+            hp = self.hp[k]
+            self.out.array[k].set_hp(int(hp) if self.hp_is_int[k] else hp)
+
+    def _run_fallback(self, i: int, phase) -> Battle.Result | None:
+        """Run one of Battle's phases on battle i with the monster objects, then reload the columns."""
+        k1, k2 = 2 * i, 2 * i + 1
+        self._write_hp(k1)
+        self._write_hp(k2)
+        battle = self._fallback
+        battle.team1, battle.team2 = self.teams[k1], self.teams[k2]
+        battle.out1, battle.out2 = self.out[k1], self.out[k2]
+        result = phase(battle)
+        self.out[k1], self.out[k2] = battle.out1, battle.out2
+        self._load(k1)
+        self._load(k2)
+        return result
+
+    def _choose_actions(self, active: array) -> None:
+        hp, speed, plain, actions = self.hp, self.speed, self.plain, self.actions
+        attack, swap = self.ATTACK, self.SWAP
+        for i in active:
+            for k in (2 * i, 2 * i + 1):
+                other = k ^ 1
+                if self.stock_policy[k] and plain[k] and plain[other]:
+                    # MonsterTeam.choose_action, on the columns.
+                    actions[k] = attack if speed[k] >= speed[other] or hp[k] >= hp[other] else swap
+                else:
+                    self._write_hp(k)
+                    self._write_hp(other)
+                    actions[k] = self.teams[k].choose_action(self.out[k], self.out[other]).value
+
+    def _change_out(self, active: array) -> None:
+        actions, out, teams = self.actions, self.out.array, self.teams.array
+        for i in active:
+            for k in (2 * i, 2 * i + 1):
+                action = actions[k]
+                if action != self.ATTACK:
+                    self._write_hp(k)
+                    out[k] = Battle.change_out(teams[k], out[k], Battle.Action(action))
+                    self._load(k)
+
+    def _attack(self, active: array) -> None:
+        hp, speed, damage, plain, actions = self.hp, self.speed, self.damage, self.plain, self.actions
+        attack = self.ATTACK
+        for i in active:
+            k1 = 2 * i
+            k2 = k1 + 1
+            attacks1 = actions[k1] == attack
+            attacks2 = actions[k2] == attack
+            if not (attacks1 or attacks2):
+                continue
+            if not (plain[k1] and plain[k2]):
+                a1, a2 = Battle.Action(actions[k1]), Battle.Action(actions[k2])
+                self._run_fallback(i, lambda battle: battle.apply_attacks(a1, a2))
+            elif attacks1 and attacks2:
+                if speed[k1] > speed[k2]:
+                    hp[k2] -= damage[k1]
+                    if hp[k2] > 0:
+                        hp[k1] -= damage[k2]
+                elif speed[k2] > speed[k1]:
+                    hp[k1] -= damage[k2]
+                    if hp[k1] > 0:
+                        hp[k2] -= damage[k1]
+                else:
+                    hp[k2] -= damage[k1]
+                    hp[k1] -= damage[k2]
+            elif attacks1:
+                hp[k2] -= damage[k1]
+            else:
+                hp[k1] -= damage[k2]
+
+    def _resolve(self, active: array) -> array:
+        """Apply end of turn damage, levelling, evolution and fainting. Returns the battles still going."""
+        hp, plain, ready = self.hp, self.plain, self.ready
+        still_active = array("l")
+        for i in active:
+            k1 = 2 * i
+            k2 = k1 + 1
+            if not (plain[k1] and plain[k2]):
+                result = self._run_fallback(i, Battle.end_turn)
+                if result is None:
+                    still_active.append(i)
+                else:
+                    self.results[i] = result
+                continue
+
+            hp1 = hp[k1]
+            hp2 = hp[k2]
+            if hp1 > 0 and hp2 > 0:
+                hp1 -= 1
+                hp2 -= 1
+                hp[k1] = hp1
+                hp[k2] = hp2
+                if hp1 > 0 and hp2 > 0 and not (ready[k1] or ready[k2]):
+                    # The usual case: nobody fainted or levelled up, so there is nothing more to do.
+                    still_active.append(i)
+                    continue
+            if hp1 > 0 and not hp2 > 0:
+                self._level_up(k1)
+            elif hp2 > 0 and not hp1 > 0:
+                self._level_up(k2)
+            self._evolve_and_replace(i, k1, k2, still_active)
+        return still_active
+
+    def _evolve_and_replace(self, i: int, k1: int, k2: int, still_active: array) -> None:
+        """The rest of the end of turn, once a monster fainted or may evolve."""
+        hp, out, teams = self.hp, self.out.array, self.teams.array
+        for k in (k1, k2):
+            if hp[k] > 0 and self.ready[k]:
+                self._write_hp(k)
+                out[k] = out[k].evolve()
+                self._load(k)
+
+        alive1 = hp[k1] > 0
+        alive2 = hp[k2] > 0
+        team1_lost = not alive1 and len(teams[k1]) == 0
+        team2_lost = not alive2 and len(teams[k2]) == 0
+        if team1_lost or team2_lost:
+            self._write_hp(k1)
+            self._write_hp(k2)
+            if team1_lost and team2_lost:
+                self.results[i] = Battle.Result.DRAW
+            elif team1_lost:
+                self.results[i] = Battle.Result.TEAM2
+            else:
+                self.results[i] = Battle.Result.TEAM1
+            return
+        if not alive1:
+            self._write_hp(k1)
+            out[k1] = teams[k1].retrieve_from_team()
+            self._load(k1)
+        if not alive2:
+            self._write_hp(k2)
+            out[k2] = teams[k2].retrieve_from_team()
+            self._load(k2)
+        still_active.append(i)
+
+    def _level_up(self, k: int) -> None:
+        self._write_hp(k)
+        self.out.array[k].level_up()
+        self._load(k)
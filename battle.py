@@ -3,6 +3,7 @@ from enum import auto
 from typing import Optional
 
 from base_enum import BaseEnum
+from monster_base import MonsterBase
 from team import MonsterTeam
 
 
@@ -18,8 +19,16 @@ class Battle:
         TEAM2 = auto()
         DRAW = auto()
 
-    def __init__(self, verbosity=0) -> None:
+    def __init__(self, verbosity=0, fast_forward=False, verify_fast_forward=False) -> None:
+        """
+        :fast_forward: Skip over runs of turns where both monsters out just trade attacks,
+            see `fast_forward_exchange`. Only turn logging (verbosity > 1) is affected.
+        :verify_fast_forward: Play every skipped run turn by turn as well, and raise
+            RuntimeError if it does not end where the fast forward said it would.
+        """
         self.verbosity = verbosity
+        self.fast_forward = fast_forward
+        self.verify_fast_forward = verify_fast_forward
 
     def process_turn(self) -> Optional[Battle.Result]:
         """
@@ -29,7 +38,147 @@ class Battle:
         * remove fainted monsters and retrieve new ones.
         * return the battle result if completed.
         """
-        raise NotImplementedError
+        self.turn_number += 1
+        if self.verbosity > 1:
+            print(f"Turn {self.turn_number}: {self.out1} vs. {self.out2}")
+        action1 = self.team1.choose_action(self.out1, self.out2)
+        action2 = self.team2.choose_action(self.out2, self.out1)
+
+        # Swaps and specials happen before any attacks.
+        self.out1 = self.change_out(self.team1, self.out1, action1)
+        self.out2 = self.change_out(self.team2, self.out2, action2)
+
+        self.apply_attacks(action1, action2)
+        return self.end_turn()
+
+    def apply_attacks(self, action1: Battle.Action, action2: Battle.Action) -> None:
+        """The attacks of a turn, in speed order. Swaps and specials must already be applied."""
+        if action1 == Battle.Action.ATTACK and action2 == Battle.Action.ATTACK:
+            speed1 = self.out1.get_speed()
+            speed2 = self.out2.get_speed()
+            if speed1 > speed2:
+                self.out1.attack(self.out2)
+                if self.out2.alive():
+                    self.out2.attack(self.out1)
+            elif speed2 > speed1:
+                self.out2.attack(self.out1)
+                if self.out1.alive():
+                    self.out1.attack(self.out2)
+            else:
+                self.out1.attack(self.out2)
+                self.out2.attack(self.out1)
+        elif action1 == Battle.Action.ATTACK:
+            self.out1.attack(self.out2)
+        elif action2 == Battle.Action.ATTACK:
+            self.out2.attack(self.out1)
+
+    def end_turn(self) -> Optional[Battle.Result]:
+        """
+        End of turn HP loss, levelling, evolving and fainting.
+        Returns the battle result if completed, otherwise retrieves replacements for fainted monsters.
+        """
+        if self.out1.alive() and self.out2.alive():
+            self.out1.set_hp(self.out1.get_hp() - 1)
+            self.out2.set_hp(self.out2.get_hp() - 1)
+
+        if self.out1.alive() and not self.out2.alive():
+            self.out1.level_up()
+        elif self.out2.alive() and not self.out1.alive():
+            self.out2.level_up()
+
+        if self.out1.alive() and self.out1.ready_to_evolve():
+            self.out1 = self.out1.evolve()
+        if self.out2.alive() and self.out2.ready_to_evolve():
+            self.out2 = self.out2.evolve()
+
+        team1_lost = not self.out1.alive() and len(self.team1) == 0
+        team2_lost = not self.out2.alive() and len(self.team2) == 0
+        if team1_lost and team2_lost:
+            return Battle.Result.DRAW
+        elif team1_lost:
+            return Battle.Result.TEAM2
+        elif team2_lost:
+            return Battle.Result.TEAM1
+
+        if not self.out1.alive():
+            self.out1 = self.team1.retrieve_from_team()
+        if not self.out2.alive():
+            self.out2 = self.team2.retrieve_from_team()
+        return None
+
+    def fast_forward_exchange(self) -> int:
+        """
+        If the next turns are certain to be plain ATTACK exchanges in which neither
+        monster out faints, apply all of them at once and return how many there were.
+        The turn where one of them faints (with its levelling and evolving) is left
+        to process_turn.
+
+        This is only certain when both teams use the stock MonsterTeam.choose_action,
+        both monsters use the stock attack, alive, get_hp and set_hp, and neither is waiting to evolve.
+        In those turns stats do not change, so each monster deals the same damage
+        every turn, and both then lose 1 HP. HP falls linearly, so the stock
+        choice of action holds for the whole run if it holds on its first and last turns.
+
+        :complexity: O(1)
+        """
+        out1, out2 = self.out1, self.out2
+        if not (self._attacks_plainly(self.team1, out1) and self._attacks_plainly(self.team2, out2)):
+            return 0
+        damage1 = out1.compute_attack_damage(out2)
+        damage2 = out2.compute_attack_damage(out1)
+        if damage1 < 0 or damage2 < 0:
+            return 0
+        hp1, hp2 = out1.get_hp(), out2.get_hp()
+        # Turns after which both are still above 0 HP.
+        turns = min((hp1 - 1) // (damage2 + 1), (hp2 - 1) // (damage1 + 1))
+        if turns <= 0:
+            return 0
+        last_hp1 = hp1 - (turns - 1) * (damage2 + 1)
+        last_hp2 = hp2 - (turns - 1) * (damage1 + 1)
+        speed1, speed2 = out1.get_speed(), out2.get_speed()
+        if speed1 < speed2 and not (hp1 >= hp2 and last_hp1 >= last_hp2):
+            return 0
+        if speed2 < speed1 and not (hp2 >= hp1 and last_hp2 >= last_hp1):
+            return 0
+
+        final_hp1 = hp1 - turns * (damage2 + 1)
+        final_hp2 = hp2 - turns * (damage1 + 1)
+        if self.verify_fast_forward:
+            for _ in range(turns):
+                if self.process_turn() is not None or self.out1 is not out1 or self.out2 is not out2:
+                    raise RuntimeError("Fast forward skipped a turn where the monsters out changed.")
+            if (out1.get_hp(), out2.get_hp()) != (final_hp1, final_hp2):
+                raise RuntimeError(
+                    f"Fast forward predicted {final_hp1} and {final_hp2} HP, "
+                    f"but got {out1.get_hp()} and {out2.get_hp()}."
+                )
+            return turns
+        out1.set_hp(final_hp1)
+        out2.set_hp(final_hp2)
+        self.turn_number += turns
+        return turns
+
+    @staticmethod
+    def _attacks_plainly(team: MonsterTeam, out: MonsterBase) -> bool:
+        """Whether this team and monster behave as the fast forward assumes."""
+        return (
+            type(team).choose_action is MonsterTeam.choose_action
+            and "choose_action" not in vars(team)
+            and type(out).has_plain_combat()
+            and not out.ready_to_evolve()
+        )
+
+    @staticmethod
+    def change_out(team: MonsterTeam, out: MonsterBase, action: Battle.Action) -> MonsterBase:
+        """Apply a SWAP or SPECIAL action, returning the monster now out for the team."""
+        if action == Battle.Action.SWAP:
+            team.add_to_team(out)
+            return team.retrieve_from_team()
+        elif action == Battle.Action.SPECIAL:
+            team.add_to_team(out)
+            team.special()
+            return team.retrieve_from_team()
+        return out
 
     def battle(self, team1: MonsterTeam, team2: MonsterTeam) -> Battle.Result:
         if self.verbosity > 0:
@@ -42,6 +191,8 @@ class Battle:
         self.out2 = team2.retrieve_from_team()
         result = None
         while result is None:
+            if self.fast_forward and self.verbosity <= 1:
+                self.fast_forward_exchange()
             result = self.process_turn()
         # Add any postgame logic here.
         return result
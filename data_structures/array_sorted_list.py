@@ -4,6 +4,7 @@
 """
 
 from data_structures.referential_array import ArrayR
+from data_structures.sorting import merge_sort
 from data_structures.sorted_list_adt import *
 
 __author__ = 'Maria Garcia de la Banda and Brendon Taylor. Modified by Alexey Ignatiev and Graeme Gange'
@@ -58,13 +59,11 @@ class ArraySortedList(SortedList[T]):
 
     def _shuffle_right(self, index: int) -> None:
         """ Shuffle items to the right up to a given position. """
-        for i in range(len(self), index, -1):
-            self.array[i] = self.array[i - 1]
+        self.array.copy_from(self.array, index, index + 1, len(self) - index)
 
     def _shuffle_left(self, index: int) -> None:
         """ Shuffle items starting at a given position to the left. """
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i + 1]
+        self.array.copy_from(self.array, index + 1, index, len(self) - index)
 
     def _resize(self) -> None:
         """ Resize the list. """
@@ -72,8 +71,7 @@ class ArraySortedList(SortedList[T]):
         new_array = ArrayR(2 * len(self.array))
 
         # copying the contents
-        for i in range(self.length):
-            new_array[i] = self.array[i]
+        new_array.copy_from(self.array, 0, 0, self.length)
 
         # referring to the new array
         self.array = new_array
@@ -109,6 +107,45 @@ class ArraySortedList(SortedList[T]):
         self[position] = item
         self.length += 1
 
+    def add_all(self, items) -> None:
+        """ Add every item of a collection supporting __len__ and __getitem__.
+
+            The batch is sorted once and then merged into the list in a single
+            backwards pass, instead of doing a binary search and shift per item.
+            Items with equal keys end up after those already in the list, in the
+            order they were given.
+            :complexity: O(n + m log m) where n is len(self) and m is len(items).
+        """
+        m = len(items)
+        if m == 0:
+            return
+        batch = ArrayR(m)
+        for k in range(m):
+            batch[k] = items[k]
+        merge_sort(batch, key=lambda item: item.key)
+
+        capacity = len(self.array)
+        while capacity < len(self) + m:
+            capacity *= 2
+        if capacity > len(self.array):
+            new_array = ArrayR(capacity)
+            new_array.copy_from(self.array, 0, 0, self.length)
+            self.array = new_array
+
+        # merging from the back, so every item is moved exactly once
+        i = len(self) - 1
+        j = m - 1
+        write = len(self) + m - 1
+        while j >= 0:
+            if i >= 0 and self.array[i].key > batch[j].key:
+                self.array[write] = self.array[i]
+                i -= 1
+            else:
+                self.array[write] = batch[j]
+                j -= 1
+            write -= 1
+        self.length += m
+
     def _index_to_add(self, item: ListItem) -> int:
         """ Find the position where the new item should be placed. """
         low = 0
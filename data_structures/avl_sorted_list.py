@@ -0,0 +1,244 @@
+"""
+    AVL tree based implementation of SortedList ADT.
+    Items to store should be of time ListItem.
+"""
+
+from __future__ import annotations
+
+from data_structures.sorted_list_adt import *
+
+__docformat__ = 'reStructuredText'
+
+
+class AVLNode(Generic[T]):
+    """ A node of the tree. Knows the height and size of the subtree rooted at it. """
+    def __init__(self, item: ListItem) -> None:
+        self.item = item
+        self.left: AVLNode | None = None
+        self.right: AVLNode | None = None
+        self.height = 1
+        self.size = 1
+
+
+class AVLSortedList(SortedList[T]):
+    """ SortedList ADT implemented with a size-augmented AVL tree.
+
+        Can be used anywhere an ArraySortedList is: positions are found from the
+        subtree sizes, so indexing, adding and deleting are all O(log n).
+        Items with equal keys are kept in the order they were added.
+    """
+
+    def __init__(self, max_capacity: int = 0) -> None:
+        """ AVLSortedList object initialiser. The capacity is accepted for
+            compatibility with ArraySortedList, but the tree has no limit.
+        """
+        SortedList.__init__(self)
+        self.root: AVLNode | None = None
+
+    def reset(self):
+        """ Reset the list. """
+        self.clear()
+
+    def clear(self) -> None:
+        """ Clear the list. """
+        SortedList.clear(self)
+        self.root = None
+
+    def is_full(self):
+        """ The tree never fills up. """
+        return False
+
+    def __getitem__(self, index: int) -> ListItem:
+        """ Magic method. Return the element at a given position.
+            :complexity: O(log n)
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('No such index in the list')
+        node = self.root
+        while True:
+            left_size = self._size(node.left)
+            if index < left_size:
+                node = node.left
+            elif index == left_size:
+                return node.item
+            else:
+                index -= left_size + 1
+                node = node.right
+
+    def __setitem__(self, index: int, item: ListItem) -> None:
+        """ Magic method. Insert the item at a given position,
+            if possible (!). Shift the following elements to the right.
+            :complexity: O(log n)
+        """
+        if not 0 <= index <= len(self) or \
+                (index > 0 and self[index - 1].key > item.key) or \
+                (index < len(self) and item.key > self[index].key):
+            raise IndexError('Element should be inserted in sorted order')
+        self.root = self._insert_at(self.root, index, item)
+        self.length += 1
+
+    def __contains__(self, item: ListItem) -> bool:
+        """ Checks if value is in the list.
+            :complexity: O(log n + k) where k is the number of items with the same key.
+        """
+        try:
+            self.index(item)
+        except ValueError:
+            return False
+        return True
+
+    def __iter__(self):
+        """ Iterate over the items in order. O(n) in total. """
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.item
+            node = node.right
+
+    def add(self, item: ListItem) -> None:
+        """ Add new element to the list, after any items with the same key.
+            :complexity: O(log n)
+        """
+        self.root = self._insert_at(self.root, self._upper_bound(item.key), item)
+        self.length += 1
+
+    def add_all(self, items) -> None:
+        """ Add every item of a collection supporting __len__ and __getitem__, in order.
+            :complexity: O(m log(n + m)) where m is len(items).
+        """
+        for i in range(len(items)):
+            self.add(items[i])
+
+    def delete_at_index(self, index: int) -> ListItem:
+        """ Delete item at a given position.
+            :complexity: O(log n)
+        """
+        if not 0 <= index < len(self):
+            raise IndexError('No such index in the list')
+        item = self[index]
+        self.root = self._delete_at(self.root, index)
+        self.length -= 1
+        return item
+
+    def index(self, item: ListItem) -> int:
+        """ Find the position of a given item in the list.
+            :complexity: O(log n + k log n) where k is the number of items with the same key.
+        """
+        pos = self._lower_bound(item.key)
+        while pos < len(self):
+            current = self[pos]
+            if current == item:
+                return pos
+            if current.key != item.key:
+                break
+            pos += 1
+        raise ValueError('item not in list')
+
+    def update_key(self, item: ListItem, key) -> None:
+        """ Change the key of an item in the list, moving it to its new position.
+            :complexity: O(log n + k log n) where k is the number of items with the old key.
+        """
+        self.remove(item)
+        item.key = key
+        self.add(item)
+
+    def _lower_bound(self, key) -> int:
+        """ Position of the first item with a key >= key. """
+        node, pos = self.root, 0
+        while node is not None:
+            if node.item.key < key:
+                pos += self._size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return pos
+
+    def _upper_bound(self, key) -> int:
+        """ Position of the first item with a key > key. """
+        node, pos = self.root, 0
+        while node is not None:
+            if node.item.key <= key:
+                pos += self._size(node.left) + 1
+                node = node.right
+            else:
+                node = node.left
+        return pos
+
+    @staticmethod
+    def _size(node: AVLNode | None) -> int:
+        return 0 if node is None else node.size
+
+    @staticmethod
+    def _height(node: AVLNode | None) -> int:
+        return 0 if node is None else node.height
+
+    def _update(self, node: AVLNode) -> None:
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def _rotate_left(self, node: AVLNode) -> AVLNode:
+        child = node.right
+        node.right = child.left
+        child.left = node
+        self._update(node)
+        self._update(child)
+        return child
+
+    def _rotate_right(self, node: AVLNode) -> AVLNode:
+        child = node.left
+        node.left = child.right
+        child.right = node
+        self._update(node)
+        self._update(child)
+        return child
+
+    def _rebalance(self, node: AVLNode) -> AVLNode:
+        """ Restore the AVL property at node, whose subtrees are balanced. """
+        self._update(node)
+        balance = self._height(node.left) - self._height(node.right)
+        if balance > 1:
+            if self._height(node.left.left) < self._height(node.left.right):
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._height(node.right.right) < self._height(node.right.left):
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+    def _insert_at(self, node: AVLNode | None, index: int, item: ListItem) -> AVLNode:
+        """ Insert item so that it ends up at position index of the subtree. """
+        if node is None:
+            return AVLNode(item)
+        left_size = self._size(node.left)
+        if index <= left_size:
+            node.left = self._insert_at(node.left, index, item)
+        else:
+            node.right = self._insert_at(node.right, index - left_size - 1, item)
+        return self._rebalance(node)
+
+    def _delete_at(self, node: AVLNode, index: int) -> AVLNode | None:
+        """ Delete the item at position index of the subtree. """
+        left_size = self._size(node.left)
+        if index < left_size:
+            node.left = self._delete_at(node.left, index)
+        elif index > left_size:
+            node.right = self._delete_at(node.right, index - left_size - 1)
+        else:
+            if node.left is None:
+                return node.right
+            if node.right is None:
+                return node.left
+            # replace with the in-order successor, then delete that from the right subtree
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.item = successor.item
+            node.right = self._delete_at(node.right, 0)
+        return self._rebalance(node)
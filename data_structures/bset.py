@@ -3,6 +3,8 @@
 """
 
 from __future__ import annotations
+from enum import Enum
+
 from data_structures.set_adt import Set
 
 class BSet(Set[int]):
@@ -36,13 +38,41 @@ class BSet(Set[int]):
 
     def __len__(self) -> int:
         """
-        Size computation. The most expensive operation.
-        Use int.bit_length(your_integer) to calculate the bit length.
+        Size computation, as the number of set bits.
+        :complexity: O(1) for sets of machine word sized elements, O(m) words in general.
+        """
+        return self.elems.bit_count()
+
+    def __iter__(self):
+        """ Iterates over the elements in increasing order.
+        :complexity: O(n) where n is the number of elements, ignoring big integer arithmetic.
+        """
+        bits = self.elems
+        while bits:
+            lowest = bits & -bits
+            yield lowest.bit_length()
+            bits ^= lowest
+
+    @classmethod
+    def from_iterable(cls, items) -> BSet[int]:
+        """ Creates a set holding every item of an iterable, such as a list or an ArrayR.
+        Enum members are stored as their value.
+        :raises TypeError: if an item is not integer or if not positive.
         """
-        res = 0
-        for item in range(1, int.bit_length(self.elems) + 1):
-            if item in self:
-                res += 1
+        elems = 0
+        for item in items:
+            if isinstance(item, Enum):
+                item = item.value
+            if not isinstance(item, int) or item <= 0:
+                raise TypeError('Set elements should be integers')
+            elems |= 1 << (item - 1)
+        return cls.from_bits(elems)
+
+    @classmethod
+    def from_bits(cls, elems: int) -> BSet[int]:
+        """ Creates a set from its bitwise representation. """
+        res = cls()
+        res.elems = elems
         return res
 
     def add(self, item: int) -> None:
@@ -97,6 +127,24 @@ class BSet(Set[int]):
     def __or__(self, other: BSet):
         return self.union(other)
 
+    def __sub__(self, other: BSet):
+        return self.difference(other)
+
+    def __ior__(self, other: BSet):
+        """ In place union, without creating a new set. """
+        self.elems |= other.elems
+        return self
+
+    def __iand__(self, other: BSet):
+        """ In place intersection, without creating a new set. """
+        self.elems &= other.elems
+        return self
+
+    def __isub__(self, other: BSet):
+        """ In place difference, without creating a new set. """
+        self.elems &= ~other.elems
+        return self
+
     def __str__(self):
         """ Construct a nice string representation. """
         bit_elems = self.elems
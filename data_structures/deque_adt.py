@@ -0,0 +1,176 @@
+""" Deque ADT and an array implementation.
+
+Defines a generic abstract double-ended queue with the usual methods, and
+implements a circular deque using arrays.
+"""
+__docformat__ = 'reStructuredText'
+
+from abc import ABC, abstractmethod
+from typing import Generic
+from data_structures.referential_array import ArrayR, T
+
+class Deque(ABC, Generic[T]):
+    """ Abstract class for a generic Deque. """
+
+    def __init__(self) -> None:
+        self.length = 0
+
+    @abstractmethod
+    def push_front(self, item: T) -> None:
+        """ Adds an element to the front of the deque."""
+        pass
+
+    @abstractmethod
+    def push_back(self, item: T) -> None:
+        """ Adds an element to the back of the deque."""
+        pass
+
+    @abstractmethod
+    def pop_front(self) -> T:
+        """ Deletes and returns the element at the deque's front."""
+        pass
+
+    @abstractmethod
+    def pop_back(self) -> T:
+        """ Deletes and returns the element at the deque's back."""
+        pass
+
+    def __len__(self) -> int:
+        """ Returns the number of elements in the deque."""
+        return self.length
+
+    def is_empty(self) -> bool:
+        """ True if the deque is empty. """
+        return len(self) == 0
+
+    @abstractmethod
+    def is_full(self) -> bool:
+        """ True if the deque is full and no element can be added. """
+        pass
+
+    def clear(self):
+        """ Clears all elements from the deque. """
+        self.length = 0
+
+class CircularDeque(Deque[T]):
+    """ Circular implementation of a deque with arrays.
+
+    Attributes:
+         length (int): number of elements in the deque (inherited)
+         front (int): index of the element at the front of the deque
+         array (ArrayR[T]): array storing the elements of the deque
+
+    Elements can be read and written by position, counting from the front,
+    and any range of positions can be reversed in place.
+
+    ArrayR cannot create empty arrays. So MIN_CAPACITY used to avoid this.
+    """
+    MIN_CAPACITY = 1
+
+    def __init__(self, max_capacity: int) -> None:
+        Deque.__init__(self)
+        self.front = 0
+        self.array = ArrayR(max(self.MIN_CAPACITY, max_capacity))
+
+    def _physical(self, index: int) -> int:
+        """ The array index of the element at a position from the front. """
+        return (self.front + index) % len(self.array)
+
+    def push_front(self, item: T) -> None:
+        """ Adds an element to the front of the deque.
+        :complexity: O(1)
+        :raises Exception: if the deque is full
+        """
+        if self.is_full():
+            raise Exception("Deque is full")
+        self.front = (self.front - 1) % len(self.array)
+        self.array[self.front] = item
+        self.length += 1
+
+    def push_back(self, item: T) -> None:
+        """ Adds an element to the back of the deque.
+        :complexity: O(1)
+        :raises Exception: if the deque is full
+        """
+        if self.is_full():
+            raise Exception("Deque is full")
+        self.array[self._physical(self.length)] = item
+        self.length += 1
+
+    def pop_front(self) -> T:
+        """ Deletes and returns the element at the deque's front.
+        :complexity: O(1)
+        :raises Exception: if the deque is empty
+        """
+        if self.is_empty():
+            raise Exception("Deque is empty")
+        item = self.array[self.front]
+        self.front = (self.front + 1) % len(self.array)
+        self.length -= 1
+        return item
+
+    def pop_back(self) -> T:
+        """ Deletes and returns the element at the deque's back.
+        :complexity: O(1)
+        :raises Exception: if the deque is empty
+        """
+        if self.is_empty():
+            raise Exception("Deque is empty")
+        self.length -= 1
+        return self.array[self._physical(self.length)]
+
+    def peek_front(self) -> T:
+        """ Returns the element at the deque's front.
+        :raises Exception: if the deque is empty
+        """
+        if self.is_empty():
+            raise Exception("Deque is empty")
+        return self.array[self.front]
+
+    def peek_back(self) -> T:
+        """ Returns the element at the deque's back.
+        :raises Exception: if the deque is empty
+        """
+        if self.is_empty():
+            raise Exception("Deque is empty")
+        return self.array[self._physical(self.length - 1)]
+
+    def __getitem__(self, index: int) -> T:
+        """ Returns the element at a position from the front.
+        :complexity: O(1)
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("invalid index")
+        return self.array[self._physical(index)]
+
+    def __setitem__(self, index: int, item: T) -> None:
+        """ Replaces the element at a position from the front.
+        :complexity: O(1)
+        """
+        if not 0 <= index < len(self):
+            raise IndexError("invalid index")
+        self.array[self._physical(index)] = item
+
+    def reverse(self, start: int = 0, stop: int = None) -> None:
+        """ Reverses the elements at positions start up to (not including) stop, in place.
+        :complexity: O(stop - start), so O(k) to reverse the first or last k elements.
+        """
+        stop = len(self) if stop is None else stop
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError("invalid range")
+        i = self._physical(start)
+        j = self._physical(stop - 1)
+        capacity = len(self.array)
+        for _ in range((stop - start) // 2):
+            self.array[i], self.array[j] = self.array[j], self.array[i]
+            i = i + 1 if i + 1 < capacity else 0
+            j = j - 1 if j > 0 else capacity - 1
+
+    def is_full(self) -> bool:
+        """ True if the deque is full and no element can be added. """
+        return len(self) == len(self.array)
+
+    def clear(self) -> None:
+        """ Clears all elements from the deque. """
+        Deque.__init__(self)
+        self.front = 0
@@ -111,6 +111,63 @@ class CircularQueue(Queue[T]):
         self.rear = 0
 
 
+class GrowableCircularQueue(CircularQueue[T]):
+    """ Circular queue with no capacity limit.
+
+    The array doubles when an append finds it full, and halves when a serve
+    leaves it at most a quarter full, so append and serve are amortised O(1)
+    and the memory used stays proportional to the number of elements.
+    The capacity never drops below the one it was created with.
+    """
+
+    def __init__(self, max_capacity: int = 0) -> None:
+        CircularQueue.__init__(self, max_capacity)
+        self.min_capacity = len(self.array)
+
+    def is_full(self) -> bool:
+        """ The queue grows instead of filling up. """
+        return False
+
+    def append(self, item: T) -> None:
+        """ Adds an element to the rear of the queue.
+        :complexity: amortised O(1), O(n) when the array has to grow.
+        """
+        if len(self) == len(self.array):
+            self._resize(2 * len(self.array))
+        CircularQueue.append(self, item)
+
+    def serve(self) -> T:
+        """ Deletes and returns the element at the queue's front.
+        :complexity: amortised O(1), O(n) when the array shrinks.
+        :raises Exception: if the queue is empty
+        """
+        front = self.front
+        item = CircularQueue.serve(self)
+        # drop the reference, so served items can be garbage collected
+        self.array[front] = None
+        if len(self.array) > self.min_capacity and 4 * len(self) <= len(self.array):
+            self._resize(max(self.min_capacity, len(self.array) // 2))
+        return item
+
+    def clear(self) -> None:
+        """ Clears all elements from the queue, going back to the initial capacity. """
+        CircularQueue.clear(self)
+        self.array = ArrayR(self.min_capacity)
+
+    def _resize(self, capacity: int) -> None:
+        """ Moves the elements to a new array of the given capacity, starting at index 0.
+        The wrap-around is undone with (at most) two block copies.
+        :complexity: O(capacity)
+        """
+        new_array = ArrayR(capacity)
+        first_part = min(len(self), len(self.array) - self.front)
+        new_array.copy_from(self.array, self.front, 0, first_part)
+        new_array.copy_from(self.array, 0, first_part, len(self) - first_part)
+        self.array = new_array
+        self.front = 0
+        self.rear = len(self) % capacity
+
+
 class TestQueue(unittest.TestCase):
     """ Tests for the above class."""
     EMPTY = 0
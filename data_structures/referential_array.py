@@ -36,7 +36,7 @@ class ArrayR(Generic[T]):
         if length < 0:
             raise ValueError("Array length should be larger than or equal to 0.")
         self.array = (length * py_object)()  # initialises the space
-        self.array[:] = [None for _ in range(length)]
+        self.array[:] = [None] * length
 
     def __len__(self) -> int:
         """Returns the length of the array
@@ -58,6 +58,62 @@ class ArrayR(Generic[T]):
         """
         self.array[index] = value
 
+    def get_slice(self, start: int, stop: int) -> ArrayR[T]:
+        """Returns a new array holding the items from start up to (not including) stop.
+        :complexity: O(stop - start), done by ctypes rather than a Python loop
+        :pre: 0 <= start <= stop <= len(self)
+        """
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError("Slice out of bounds")
+        ret = ArrayR(stop - start)
+        ret.array[:] = self.array[start:stop]
+        return ret
+
+    def set_slice(self, start: int, values: ArrayR[T] | list[T]) -> None:
+        """Overwrites the items from start onwards with the items of values.
+        :complexity: O(len(values))
+        :pre: 0 <= start and start + len(values) <= len(self)
+        """
+        if not 0 <= start <= start + len(values) <= len(self):
+            raise IndexError("Slice does not fit in the array")
+        if isinstance(values, ArrayR):
+            values = values.array[:]
+        self.array[start:start + len(values)] = values
+
+    def copy_from(self, src: ArrayR[T], src_start: int, dst_start: int, n: int) -> None:
+        """Copies n items of src, starting at src_start, into this array starting at dst_start.
+        src may be this array, and the two ranges may overlap.
+
+        Slice assignment is used rather than ctypes.memmove: moving raw py_object
+        pointers would skip the reference counting ctypes does on assignment.
+        :complexity: O(n), done by ctypes rather than a Python loop
+        """
+        if n <= 0:
+            return
+        if src_start < 0 or dst_start < 0 or src_start + n > len(src) or dst_start + n > len(self):
+            raise IndexError("Copy range out of bounds")
+        self.array[dst_start:dst_start + n] = src.array[src_start:src_start + n]
+
+    def fill(self, value: T, start: int = 0, stop: int | None = None) -> None:
+        """Sets every item from start up to (not including) stop to value.
+        :complexity: O(stop - start)
+        :pre: 0 <= start <= stop <= len(self)
+        """
+        stop = len(self) if stop is None else stop
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError("Fill range out of bounds")
+        self.array[start:stop] = [value] * (stop - start)
+
+    def view(self, start: int = 0, stop: int | None = None) -> ArrayView[T]:
+        """Returns a window onto the items from start up to (not including) stop, without copying.
+        Writes through the view change this array.
+        :complexity: O(1)
+        """
+        stop = len(self) if stop is None else stop
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError("View out of bounds")
+        return ArrayView(self, start, stop)
+
     def index(self, item: T) -> T:
         for index, arr_item in enumerate(self.array):
             if arr_item == item:
@@ -77,12 +133,48 @@ class ArrayR(Generic[T]):
     @classmethod
     def from_list(cls, l: list[T]) -> ArrayR[T]:
         ret = ArrayR(len(l))
-        for x in range(len(l)):
-            ret[x] = l[x]
+        ret.array[:] = l
         return ret
 
+    def __reduce__(self):
+        """ctypes arrays of py_object cannot be pickled, so pickle the items instead.
+        Lets ArrayR (and the ADTs built on it) cross process boundaries.
+        """
+        return (ArrayR.from_list, (self.to_list(),))
+
     def to_list(self) -> list[T]:
-        ret = []
-        for x in range(len(self)):
-            ret.append(self[x])
-        return ret
+        return self.array[:]
+
+
+class ArrayView(Generic[T]):
+    """A window onto part of an ArrayR, sharing its storage.
+
+    Supports the same reading and writing interface as ArrayR, with indices
+    relative to the start of the window.
+    """
+
+    def __init__(self, base: ArrayR[T], start: int, stop: int) -> None:
+        self.base = base
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, index: int) -> T:
+        """:complexity: O(1)"""
+        if not 0 <= index < self.stop - self.start:
+            raise IndexError("invalid index")
+        return self.base.array[self.start + index]
+
+    def __setitem__(self, index: int, value: T) -> None:
+        """:complexity: O(1)"""
+        if not 0 <= index < self.stop - self.start:
+            raise IndexError("invalid index")
+        self.base.array[self.start + index] = value
+
+    def to_list(self) -> list[T]:
+        return list(self.base.array[self.start:self.stop])
+
+    def __str__(self) -> str:
+        return "[" + ", ".join(str(item) for item in self.to_list()) + "]"
@@ -0,0 +1,156 @@
+"""
+    Stable sorting of arrays in place.
+
+    Works on ArrayR, or anything else supporting __len__, __getitem__ and
+    __setitem__. Items are ordered by key(item) (the item itself if no key is
+    given), and items with equal keys keep their relative order.
+"""
+
+from __future__ import annotations
+from typing import Callable, TypeVar
+
+from data_structures.referential_array import ArrayR
+
+__docformat__ = 'reStructuredText'
+
+T = TypeVar('T')
+
+# Runs shorter than this are sorted by insertion before being merged.
+MIN_RUN = 16
+
+
+def merge_sort(array, key: Callable[[T], object] = None, start: int = 0, stop: int = None) -> None:
+    """ Stable sort of array[start:stop] in place.
+
+        Keys are computed once per item. Short runs are insertion sorted, then
+        merged bottom up through a single scratch buffer.
+        :complexity: O(n log n) where n is stop - start, even if already sorted:
+            ordered runs are copied rather than merged, but every pass still copies all n items.
+    """
+    stop = len(array) if stop is None else stop
+    n = stop - start
+    if n < 2:
+        return
+    items = ArrayR(n)
+    keys = ArrayR(n)
+    for i in range(n):
+        items[i] = array[start + i]
+        keys[i] = items[i] if key is None else key(items[i])
+
+    for lo in range(0, n, MIN_RUN):
+        _insertion_sort(items, keys, lo, min(lo + MIN_RUN, n))
+
+    scratch_items = ArrayR(n)
+    scratch_keys = ArrayR(n)
+    width = MIN_RUN
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid < hi and keys[mid - 1] > keys[mid]:
+                _merge(items, keys, scratch_items, scratch_keys, lo, mid, hi)
+            else:
+                # already in order, or nothing to merge with
+                scratch_items.copy_from(items, lo, lo, hi - lo)
+                scratch_keys.copy_from(keys, lo, lo, hi - lo)
+        items, scratch_items = scratch_items, items
+        keys, scratch_keys = scratch_keys, keys
+        width *= 2
+
+    for i in range(n):
+        array[start + i] = items[i]
+
+
+def top_k(array, k: int, key: Callable[[T], object] = None) -> ArrayR[T]:
+    """ The k items with the smallest keys, in stable sorted order.
+
+        Keeps a max-heap of the best k seen so far, so only O(k) extra space is used.
+        Items with equal keys are taken in order of position, like a full stable sort would.
+        :complexity: O(n log k) where n is len(array).
+    """
+    n = len(array)
+    k = max(0, min(k, n))
+    heap_items = ArrayR(k)
+    heap_keys = ArrayR(k)
+    size = 0
+    for i in range(n):
+        item = array[i]
+        # ties are broken on position, so later items lose
+        rank = (item if key is None else key(item), i)
+        if size < k:
+            heap_items[size] = item
+            heap_keys[size] = rank
+            size += 1
+            _sift_up(heap_items, heap_keys, size - 1)
+        elif k > 0 and rank < heap_keys[0]:
+            heap_items[0] = item
+            heap_keys[0] = rank
+            _sift_down(heap_items, heap_keys, 0, size)
+
+    # heap sort in place: repeatedly move the largest to the end
+    for end in range(size - 1, 0, -1):
+        _swap(heap_items, heap_keys, 0, end)
+        _sift_down(heap_items, heap_keys, 0, end)
+    return heap_items
+
+
+def _insertion_sort(items: ArrayR, keys: ArrayR, lo: int, hi: int) -> None:
+    for i in range(lo + 1, hi):
+        item = items[i]
+        item_key = keys[i]
+        j = i
+        while j > lo and keys[j - 1] > item_key:
+            items[j] = items[j - 1]
+            keys[j] = keys[j - 1]
+            j -= 1
+        items[j] = item
+        keys[j] = item_key
+
+
+def _merge(items: ArrayR, keys: ArrayR, out_items: ArrayR, out_keys: ArrayR, lo: int, mid: int, hi: int) -> None:
+    """ Merge the sorted runs [lo, mid) and [mid, hi) into out, preferring the left run on ties. """
+    i, j = lo, mid
+    k = lo
+    while i < mid and j < hi:
+        if keys[j] < keys[i]:
+            out_items[k] = items[j]
+            out_keys[k] = keys[j]
+            j += 1
+        else:
+            out_items[k] = items[i]
+            out_keys[k] = keys[i]
+            i += 1
+        k += 1
+    # one of the runs is exhausted, the rest of the other is copied as a block
+    if i < mid:
+        out_items.copy_from(items, i, k, mid - i)
+        out_keys.copy_from(keys, i, k, mid - i)
+    else:
+        out_items.copy_from(items, j, k, hi - j)
+        out_keys.copy_from(keys, j, k, hi - j)
+
+
+def _swap(items: ArrayR, keys: ArrayR, a: int, b: int) -> None:
+    items[a], items[b] = items[b], items[a]
+    keys[a], keys[b] = keys[b], keys[a]
+
+
+def _sift_up(items: ArrayR, keys: ArrayR, pos: int) -> None:
+    while pos > 0:
+        parent = (pos - 1) // 2
+        if keys[parent] >= keys[pos]:
+            return
+        _swap(items, keys, parent, pos)
+        pos = parent
+
+
+def _sift_down(items: ArrayR, keys: ArrayR, pos: int, size: int) -> None:
+    while True:
+        largest = pos
+        for child in (2 * pos + 1, 2 * pos + 2):
+            if child < size and keys[child] > keys[largest]:
+                largest = child
+        if largest == pos:
+            return
+        _swap(items, keys, pos, largest)
+        pos = largest
@@ -99,6 +99,57 @@ class ArrayStack(Stack[T]):
             raise Exception("Stack is empty")
         return self.array[self.length-1]
 
+
+class GrowableArrayStack(ArrayStack[T]):
+    """ Array stack with no capacity limit.
+
+    The array doubles when a push finds it full, and halves when a pop
+    leaves it at most a quarter full, so push and pop are amortised O(1)
+    and the memory used stays proportional to the number of elements.
+    The capacity never drops below the one it was created with.
+    """
+
+    def __init__(self, max_capacity: int = 0) -> None:
+        ArrayStack.__init__(self, max_capacity)
+        self.min_capacity = len(self.array)
+
+    def is_full(self) -> bool:
+        """ The stack grows instead of filling up. """
+        return False
+
+    def push(self, item: T) -> None:
+        """ Pushes an element to the top of the stack.
+        :complexity: amortised O(1), O(n) when the array has to grow.
+        """
+        if len(self) == len(self.array):
+            self._resize(2 * len(self.array))
+        ArrayStack.push(self, item)
+
+    def pop(self) -> T:
+        """ Pops the element at the top of the stack.
+        :complexity: amortised O(1), O(n) when the array shrinks.
+        :raises Exception: if the stack is empty
+        """
+        item = ArrayStack.pop(self)
+        # drop the reference, so popped items can be garbage collected
+        self.array[self.length] = None
+        if len(self.array) > self.min_capacity and 4 * len(self) <= len(self.array):
+            self._resize(max(self.min_capacity, len(self.array) // 2))
+        return item
+
+    def clear(self) -> None:
+        """ Clears all elements from the stack, going back to the initial capacity. """
+        ArrayStack.clear(self)
+        self.array = ArrayR(self.min_capacity)
+
+    def _resize(self, capacity: int) -> None:
+        """ Moves the elements to a new array of the given capacity with a block copy.
+        :complexity: O(capacity)
+        """
+        new_array = ArrayR(capacity)
+        new_array.copy_from(self.array, 0, 0, len(self))
+        self.array = new_array
+
 class TestStack(unittest.TestCase):
     """ Tests for the above class."""
     EMPTY = 0
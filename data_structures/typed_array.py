@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+""" Typed numeric arrays, with the same interface as ArrayR.
+
+ArrayR holds references, so an ArrayR of numbers is really an array of
+pointers to separately allocated int or float objects. ArrayI and ArrayF
+instead store the numbers themselves, packed next to each other, using
+the standard library's array module. The storage (self.array) supports
+the buffer protocol, so it can be handed to anything that accepts
+buffers (memoryview, numpy.frombuffer, ...) without copying.
+"""
+__docformat__ = "reStructuredText"
+
+from array import array
+
+from data_structures.referential_array import ArrayView
+
+
+class _TypedArray:
+    """Shared implementation of ArrayI and ArrayF. Subclasses set TYPECODE."""
+
+    TYPECODE: str = None
+
+    def __init__(self, length: int) -> None:
+        """Creates an array of the given length, with every item set to 0
+        :complexity: O(length) for best/worst case to initialise to 0
+        :pre: length >= 0
+        """
+        if length < 0:
+            raise ValueError("Array length should be larger than or equal to 0.")
+        self.array = array(self.TYPECODE, bytes(length * array(self.TYPECODE).itemsize))
+
+    def __len__(self) -> int:
+        """Returns the length of the array
+        :complexity: O(1)
+        """
+        return len(self.array)
+
+    def __getitem__(self, index: int):
+        """Returns the number in position index.
+        :complexity: O(1)
+        :pre: index in between 0 and length - self.array[] checks it
+        """
+        return self.array[index]
+
+    def __setitem__(self, index: int, value) -> None:
+        """Sets the number in position index to value
+        :complexity: O(1)
+        :pre: index in between 0 and length - self.array[] checks it
+        """
+        self.array[index] = value
+
+    def get_slice(self, start: int, stop: int):
+        """Returns a new array holding the items from start up to (not including) stop.
+        :complexity: O(stop - start)
+        :pre: 0 <= start <= stop <= len(self)
+        """
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError("Slice out of bounds")
+        ret = type(self)(0)
+        ret.array = self.array[start:stop]
+        return ret
+
+    def set_slice(self, start: int, values) -> None:
+        """Overwrites the items from start onwards with the items of values.
+        :complexity: O(len(values))
+        :pre: 0 <= start and start + len(values) <= len(self)
+        """
+        if not 0 <= start <= start + len(values) <= len(self):
+            raise IndexError("Slice does not fit in the array")
+        if isinstance(values, _TypedArray):
+            values = values.array
+        if not isinstance(values, array) or values.typecode != self.TYPECODE:
+            values = array(self.TYPECODE, values)
+        self.array[start:start + len(values)] = values
+
+    def copy_from(self, src, src_start: int, dst_start: int, n: int) -> None:
+        """Copies n items of src, starting at src_start, into this array starting at dst_start.
+        src may be this array, and the two ranges may overlap.
+        :complexity: O(n), done as a single block copy
+        """
+        if n <= 0:
+            return
+        if src_start < 0 or dst_start < 0 or src_start + n > len(src) or dst_start + n > len(self):
+            raise IndexError("Copy range out of bounds")
+        self.set_slice(dst_start, src.array[src_start:src_start + n])
+
+    def fill(self, value, start: int = 0, stop: int | None = None) -> None:
+        """Sets every item from start up to (not including) stop to value.
+        :complexity: O(stop - start)
+        :pre: 0 <= start <= stop <= len(self)
+        """
+        stop = len(self) if stop is None else stop
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError("Fill range out of bounds")
+        self.array[start:stop] = array(self.TYPECODE, [value]) * (stop - start)
+
+    def view(self, start: int = 0, stop: int | None = None) -> ArrayView:
+        """Returns a window onto the items from start up to (not including) stop, without copying.
+        :complexity: O(1)
+        """
+        stop = len(self) if stop is None else stop
+        if not 0 <= start <= stop <= len(self):
+            raise IndexError("View out of bounds")
+        return ArrayView(self, start, stop)
+
+    def index(self, item) -> int:
+        try:
+            return self.array.index(item)
+        except ValueError:
+            raise ValueError("Value does not exist")
+
+    def __str__(self) -> str:
+        return "[" + ", ".join(str(item) for item in self.array) + "]"
+
+    @classmethod
+    def from_list(cls, l: list):
+        ret = cls(0)
+        ret.array = array(cls.TYPECODE, l)
+        return ret
+
+    def to_list(self) -> list:
+        return self.array.tolist()
+
+    def memoryview(self) -> memoryview:
+        """A view of the raw storage, for code that reads buffers directly.
+        :complexity: O(1)
+        """
+        return memoryview(self.array)
+
+
+class ArrayI(_TypedArray):
+    """An array of 64 bit signed integers."""
+    TYPECODE = "q"
+
+
+class ArrayF(_TypedArray):
+    """An array of double precision floats."""
+    TYPECODE = "d"
@@ -41,10 +41,21 @@ class Element(BaseEnum):
 
     @classmethod
     def from_string(cls, string: str) -> Element:
-        for elem in Element:
-            if elem.name.lower() == string.lower():
-                return elem
-        raise ValueError(f"Unexpected string {string}")
+        """Case insensitive lookup by name. O(1), using _ELEMENTS_BY_NAME."""
+        element = _ELEMENTS_BY_NAME.get(string)
+        if element is None:
+            # Not in one of the precomputed spellings, so try again lowercased.
+            element = _ELEMENTS_BY_NAME.get(string.lower())
+            if element is None:
+                raise ValueError(f"Unexpected string {string}")
+        return element
+
+# Each element by its lowercase, uppercase and capitalised name, so common spellings need no .lower() call.
+_ELEMENTS_BY_NAME: dict[str, Element] = {}
+for _element in Element:
+    for _spelling in (_element.name.lower(), _element.name, _element.name.capitalize()):
+        _ELEMENTS_BY_NAME[_spelling] = _element
+del _element, _spelling
 
 class EffectivenessCalculator:
     """
@@ -58,6 +69,8 @@ class EffectivenessCalculator:
 
     instance: Optional[EffectivenessCalculator] = None
 
+    N_ELEMENTS = len(Element)
+
     def __init__(self, element_names: ArrayR[str], effectiveness_values: ArrayR[float]) -> None:
         """
         Initialise the Effectiveness Calculator.
@@ -75,7 +88,19 @@ class EffectivenessCalculator:
         Water is double effective to Fire, and half effective to Water and Grass [2, 0.5, 0.5]
         Grass is half effective to Fire and Grass, and double effective to Water [0.5, 2, 0.5]
         """
-        raise NotImplementedError
+        self.element_names = element_names
+        self.effectiveness_values = effectiveness_values
+
+        # Re-index the values by Element.value once, so lookups need no name translation.
+        # table[(attacker.value - 1) * N_ELEMENTS + (defender.value - 1)]
+        n = len(element_names)
+        rows = ArrayR(n)
+        for i in range(n):
+            rows[i] = Element.from_string(element_names[i]).value - 1
+        self.table = ArrayR(self.N_ELEMENTS * self.N_ELEMENTS)
+        for i in range(n):
+            for j in range(n):
+                self.table[rows[i] * self.N_ELEMENTS + rows[j]] = effectiveness_values[i * n + j]
 
     @classmethod
     def get_effectiveness(cls, type1: Element, type2: Element) -> float:
@@ -83,8 +108,25 @@ class EffectivenessCalculator:
         Returns the effectivness of elem1 attacking elem2.
 
         Example: EffectivenessCalculator.get_effectiveness(Element.FIRE, Element.WATER) == 0.5
+
+        :complexity: O(1)
+        """
+        return cls.instance.table[(type1.value - 1) * cls.N_ELEMENTS + type2.value - 1]
+
+    @classmethod
+    def get_effectiveness_many(cls, attackers: ArrayR[Element], defenders: ArrayR[Element]) -> ArrayR[float]:
+        """
+        Returns the effectiveness of attackers[i] attacking defenders[i] for every i.
+
+        :complexity: O(n) best/worst case, where n is the length of attackers.
         """
-        raise NotImplementedError
+        if len(attackers) != len(defenders):
+            raise ValueError("attackers and defenders must have the same length.")
+        table = cls.instance.table
+        res = ArrayR(len(attackers))
+        for i in range(len(attackers)):
+            res[i] = table[(attackers[i].value - 1) * cls.N_ELEMENTS + defenders[i].value - 1]
+        return res
 
     @classmethod
     def from_csv(cls, csv_file: str) -> EffectivenessCalculator:
@@ -1,4 +1,7 @@
 from __future__ import annotations
+import hashlib
+import marshal
+import os
 import yaml
 from typing import TYPE_CHECKING
 
@@ -9,63 +12,190 @@ if TYPE_CHECKING:
 
 
 _monsters: ArrayR[MonsterBase] = None
+_spawnable: ArrayR[MonsterBase] = None
+_roster_by_name: dict[str, dict] = None
+# Names of the monster classes created so far.
+_created: set[str] = set()
+
+# The libyaml loader is much faster, but is only present if PyYAML was built against libyaml.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# Bump when the layout of the roster cache changes.
+ROSTER_CACHE_VERSION = 1
 
 
 def MonsterBaseFactory(name, description, evolution, element, simple_stats, complex_stats, can_be_spawned) -> type[MonsterBase]:
-    from monster_base import MonsterBase
+    from monster_base import MonsterBase, MonsterRecord
+    record = MonsterRecord(name, description, evolution, element, simple_stats, complex_stats, can_be_spawned)
     return type(name, (MonsterBase, ), {
-        "get_name": classmethod(lambda s: name),
-        "get_description": classmethod(lambda s: description),
-        # This will be defined later when we have all names.
-        "get_evolution": classmethod(lambda s: None),
-        "get_element": classmethod(lambda s: element),
-        "get_simple_stats": classmethod(lambda s: simple_stats),
-        "get_complex_stats": classmethod(lambda s: complex_stats),
-        "can_be_spawned": classmethod(lambda s: can_be_spawned),
+        # Classes are published as globals of this module, so they pickle by reference.
+        "__module__": __name__,
+        # Keep the slotted layout of MonsterBase, rather than adding a __dict__ to every instance.
+        "__slots__": (),
+        "record": record,
+        "get_name": classmethod(lambda s: record.name),
+        "get_description": classmethod(lambda s: record.description),
+        "get_evolution": classmethod(_get_evolution),
+        "get_element": classmethod(lambda s: record.element_name),
+        "get_simple_stats": classmethod(lambda s: record.simple_stats),
+        "get_complex_stats": classmethod(lambda s: record.complex_stats),
+        "can_be_spawned": classmethod(lambda s: record.can_be_spawned),
     })
 
+def _get_evolution(cls) -> type[MonsterBase] | None:
+    """The evolution of a factory made class. It is only created once something asks for it."""
+    record = cls.record
+    if record.evolution is None and record.evolution_name is not None:
+        record.evolution = _make_monster_class(record.evolution_name)
+    return record.evolution
+
 def get_all_monsters():
     if _monsters is None:
         _make_all_monster_classes()
     return _monsters
 
-def _make_all_monster_classes():
+def get_spawnable_monsters():
+    """The monster classes that can be spawned on a team, in roster order."""
+    global _spawnable
+    if _spawnable is None:
+        monsters = get_all_monsters()
+        n_spawnable = 0
+        for x in range(len(monsters)):
+            if monsters[x].can_be_spawned():
+                n_spawnable += 1
+        spawnable = ArrayR(n_spawnable)
+        idx = 0
+        for x in range(len(monsters)):
+            if monsters[x].can_be_spawned():
+                spawnable[idx] = monsters[x]
+                idx += 1
+        _spawnable = spawnable
+    return _spawnable
+
+def _roster() -> dict[str, dict]:
+    """The YAML entry of every monster, by name, in file order."""
+    global _roster_by_name
+    if _roster_by_name is None:
+        roster = {}
+        for monster in load_roster("monsters.yaml"):
+            roster[monster["name"]] = monster
+        _roster_by_name = roster
+    return _roster_by_name
+
+def _make_monster_class(name: str) -> type[MonsterBase]:
+    """Create the class for a single monster, or return it if it was already created."""
     from stats import SimpleStats, ComplexStats
+    if name in _created:
+        return globals()[name]
+    monster = _roster()[name]
+    simple = monster["simple"]
+    complex = monster["complex"]
+    new_class = MonsterBaseFactory(
+        monster["name"],
+        monster["description"],
+        monster.get("evolution", None),
+        monster["element"],
+        SimpleStats(simple["attack"], simple["defense"], simple["speed"], simple["max_hp"]),
+        ComplexStats(
+            ArrayR.from_list(str(complex["attack"]).split()),
+            ArrayR.from_list(str(complex["defense"]).split()),
+            ArrayR.from_list(str(complex["speed"]).split()),
+            ArrayR.from_list(str(complex["max_hp"]).split()),
+        ),
+        monster.get("can_be_spawned", False)
+    )
+    globals()[name] = new_class
+    _created.add(name)
+    return new_class
+
+def _make_all_monster_classes():
     global _monsters
-    with open("monsters.yaml", "r") as f:
-        monsters_yaml = yaml.safe_load(f)
-    _monsters = ArrayR(len(monsters_yaml))
+    roster = _roster()
+    monsters = ArrayR(len(roster))
     idx = 0
-    for monster in monsters_yaml:
-        simple = monster["simple"]
-        complex = monster["complex"]
-        new_class = MonsterBaseFactory(
-            monster["name"],
-            monster["description"],
-            monster.get("evolution", None),
-            monster["element"],
-            SimpleStats(simple["attack"], simple["defense"], simple["speed"], simple["max_hp"]),
-            ComplexStats(
-                ArrayR.from_list(str(complex["attack"]).split()),
-                ArrayR.from_list(str(complex["defense"]).split()),
-                ArrayR.from_list(str(complex["speed"]).split()),
-                ArrayR.from_list(str(complex["max_hp"]).split()),
-            ),
-            monster.get("can_be_spawned", False)
-        )
-        globals()[monster["name"]] = new_class
-        _monsters[idx] = new_class
+    for name in roster:
+        monsters[idx] = _make_monster_class(name)
         idx += 1
-    # Now assign evolution
-    for monster in monsters_yaml:
-        evolution = monster.get("evolution", None)
-        if evolution is None:
-            continue
-        evolution_class = globals()[evolution]
-        globals()[monster["name"]].evolution_class = evolution_class
-        globals()[monster["name"]].get_evolution = classmethod(lambda s: s.evolution_class)
-
-get_all_monsters()
+    _monsters = monsters
+
+def __getattr__(name: str):
+    """Monster classes are created the first time they are looked up on this module."""
+    # Monster names are capitalised class names, anything else is not worth reading the roster for.
+    if name[:1].isupper() and name.isidentifier():
+        try:
+            roster = _roster()
+        except (OSError, yaml.YAMLError) as e:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}, the roster could not be loaded") from e
+        if name in roster:
+            return _make_monster_class(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def roster_cache_path(yaml_path: str) -> str:
+    directory, name = os.path.split(yaml_path)
+    return os.path.join(directory, "__pycache__", name + ".marshal")
+
+def load_roster(yaml_path: str) -> list[dict]:
+    """
+    The parsed contents of a roster YAML file.
+
+    The parse is cached with marshal in __pycache__, keyed on the file's mtime, size and hash.
+    If the mtime or size changed, the hash decides whether the cache is still fresh.
+    The cache is best effort: any problem reading or writing it falls back to parsing the YAML.
+    """
+    stat = os.stat(yaml_path)
+    cache_path = roster_cache_path(yaml_path)
+    cached = None
+    try:
+        with open(cache_path, "rb") as f:
+            cached = marshal.load(f)
+        version, mtime_ns, size, digest, roster = cached
+        if version == ROSTER_CACHE_VERSION and mtime_ns == stat.st_mtime_ns and size == stat.st_size:
+            return roster
+    except (OSError, EOFError, ValueError, TypeError):
+        cached = None
+
+    with open(yaml_path, "rb") as f:
+        raw = f.read()
+    new_digest = hashlib.sha256(raw).hexdigest()
+    if cached is not None and version == ROSTER_CACHE_VERSION and digest == new_digest:
+        # Touched but unchanged.
+        roster = cached[4]
+    else:
+        roster = yaml.load(raw, Loader=YAML_LOADER)
+    _write_roster_cache(cache_path, (ROSTER_CACHE_VERSION, stat.st_mtime_ns, stat.st_size, new_digest, roster))
+    return roster
+
+def _write_roster_cache(cache_path: str, entry: tuple) -> None:
+    # Written to a temporary file first, so concurrently starting workers never read half a cache.
+    # Values marshal cannot store (such as dates) raise ValueError, and the roster is then just not cached.
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            marshal.dump(entry, f)
+        os.replace(tmp_path, cache_path)
+    except (OSError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+def precompute_stat_tables(max_level: int = 100):
+    """
+    Materialise the stats of every monster class for levels 1..max_level,
+    so instances read them from a StatTable instead of the stats classes.
+
+    Classes with non-integer stats, or stats too large for the table, keep computing them on demand.
+    Only affects monsters created after this call: every monster keeps reading
+    the table (or lack of one) its class had when it was created.
+    """
+    from stats import StatTable
+    monsters = get_all_monsters()
+    for i in range(len(monsters)):
+        monster = monsters[i]
+        try:
+            monster.stat_table = StatTable(monster.get_simple_stats(), monster.get_complex_stats(), max_level)
+        except (TypeError, OverflowError):
+            monster.stat_table = None
 
 if TYPE_CHECKING:
     # Makes no sense but fixes the red squigglies
@@ -1,10 +1,104 @@
 from __future__ import annotations
 import abc
+import math
+
+from stats import Stats, StatTable
+from elements import EffectivenessCalculator, Element
+
+from data_structures.referential_array import ArrayR
+
+class MonsterRecord:
+    """
+    The constant data of one monster type, shared by every instance of it (and its subclasses).
+
+    Built once by helpers.MonsterBaseFactory, with the element already parsed into an Element.
+    The evolution is looked up by name the first time it is needed, then kept here.
+    """
+
+    __slots__ = (
+        "name", "description", "element_name", "element", "evolution_name", "evolution",
+        "simple_stats", "complex_stats", "can_be_spawned",
+    )
+
+    def __init__(self, name, description, evolution_name, element_name, simple_stats, complex_stats, can_be_spawned) -> None:
+        self.name = name
+        self.description = description
+        self.element_name = element_name
+        self.element = Element.from_string(element_name)
+        self.evolution_name = evolution_name
+        self.evolution = None
+        self.simple_stats = simple_stats
+        self.complex_stats = complex_stats
+        self.can_be_spawned = can_be_spawned
+
+
+class DamageCache:
+    """
+    A bounded, direct-mapped memo of attack damage.
+
+    Damage only depends on the attacking and defending monster types, modes and levels,
+    so those are the key. Each key can only live in the one slot its hash picks,
+    and a new entry simply replaces whatever was there.
+
+    Usage:
+    ```
+    MonsterBase.damage_cache = DamageCache(4096)
+    ...
+    print(MonsterBase.damage_cache.hits, MonsterBase.damage_cache.misses)
+    ```
+
+    Only valid while the stats of each type are a pure function of its level,
+    and the effectiveness table does not change; call `clear` if it does.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        """:capacity: Number of slots, rounded up to a power of two."""
+        size = 1
+        while size < capacity:
+            size *= 2
+        self.capacity = size
+        self.mask = size - 1
+        self.keys = ArrayR(size)
+        self.damages = ArrayR(size)
+        self.hits = 0
+        self.misses = 0
+
+    def lookup(self, key: tuple) -> int | None:
+        """The damage stored for key, or None. O(1)"""
+        slot = hash(key) & self.mask
+        if self.keys[slot] == key:
+            self.hits += 1
+            return self.damages[slot]
+        self.misses += 1
+        return None
+
+    def store(self, key: tuple, damage: int) -> None:
+        """Remember the damage for key, evicting whatever shared its slot. O(1)"""
+        slot = hash(key) & self.mask
+        self.keys[slot] = key
+        self.damages[slot] = damage
+
+    def clear(self) -> None:
+        """Forget every entry and reset the counters."""
+        self.keys.fill(None)
+        self.damages.fill(None)
+        self.hits = 0
+        self.misses = 0
 
-from stats import Stats
 
 class MonsterBase(abc.ABC):
 
+    # Instances only hold these, with no per-instance __dict__.
+    # Everything shared by a monster type lives on its class.
+    __slots__ = ("simple_mode", "level", "original_level", "stat_source", "stat_row", "hp")
+
+    # Filled in per class by helpers.precompute_stat_tables
+    stat_table: StatTable = None
+    # Filled in per class by helpers.MonsterBaseFactory
+    record: MonsterRecord = None
+    # Shared by every monster. Damage is not memoised unless this is set to a DamageCache.
+    damage_cache: DamageCache = None
+
     def __init__(self, simple_mode=True, level:int=1) -> None:
         """
         Initialise an instance of a monster.
@@ -12,43 +106,70 @@ class MonsterBase(abc.ABC):
         :simple_mode: Whether to use the simple or complex stats of this monster
         :level: The starting level of this monster. Defaults to 1.
         """
-        raise NotImplementedError
+        self.simple_mode = simple_mode
+        self.level = level
+        self.original_level = level
+        # The table this instance reads, fixed at creation so replacing the class's table later is safe.
+        self.stat_source = self.stat_table
+        self.stat_row = -1 if self.stat_source is None else self.stat_source.row(simple_mode, level)
+        self.hp = self.get_max_hp()
 
     def get_level(self):
         """The current level of this monster instance"""
-        raise NotImplementedError
+        return self.level
 
     def level_up(self):
         """Increase the level of this monster instance by 1"""
-        raise NotImplementedError
+        # Levelling up keeps the amount of damage taken, not the current HP.
+        max_hp_before = self.get_max_hp()
+        self.level += 1
+        if self.stat_source is not None:
+            self.stat_row = self.stat_source.row(self.simple_mode, self.level)
+        self.set_hp(self.get_hp() + self.get_max_hp() - max_hp_before)
 
     def get_hp(self):
         """Get the current HP of this monster instance"""
-        raise NotImplementedError
+        return self.hp
 
     def set_hp(self, val):
         """Set the current HP of this monster instance"""
-        raise NotImplementedError
+        self.hp = val
 
     def get_attack(self):
         """Get the attack of this monster instance"""
-        raise NotImplementedError
+        if self.stat_row >= 0:
+            return self.stat_source.values[self.stat_row + StatTable.ATTACK]
+        if self.simple_mode:
+            return self.get_simple_stats().get_attack()
+        return self.get_complex_stats().get_attack(self.get_level())
 
     def get_defense(self):
         """Get the defense of this monster instance"""
-        raise NotImplementedError
+        if self.stat_row >= 0:
+            return self.stat_source.values[self.stat_row + StatTable.DEFENSE]
+        if self.simple_mode:
+            return self.get_simple_stats().get_defense()
+        return self.get_complex_stats().get_defense(self.get_level())
 
     def get_speed(self):
         """Get the speed of this monster instance"""
-        raise NotImplementedError
+        if self.stat_row >= 0:
+            return self.stat_source.values[self.stat_row + StatTable.SPEED]
+        if self.simple_mode:
+            return self.get_simple_stats().get_speed()
+        return self.get_complex_stats().get_speed(self.get_level())
 
     def get_max_hp(self):
         """Get the maximum HP of this monster instance"""
-        raise NotImplementedError
+        if self.stat_row >= 0:
+            return self.stat_source.values[self.stat_row + StatTable.MAX_HP]
+        if self.simple_mode:
+            return self.get_simple_stats().get_max_hp()
+        return self.get_complex_stats().get_max_hp(self.get_level())
 
     def alive(self) -> bool:
         """Whether the current monster instance is alive (HP > 0 )"""
-        raise NotImplementedError
+        return self.get_hp() > 0
 
     def attack(self, other: MonsterBase):
         """Attack another monster instance"""
@@ -56,15 +177,66 @@ class MonsterBase(abc.ABC):
         # Step 2: Apply type effectiveness
         # Step 3: Ceil to int
         # Step 4: Lose HP
-        raise NotImplementedError
+        cache = MonsterBase.damage_cache
+        if cache is None:
+            damage = self.compute_attack_damage(other)
+        else:
+            key = (type(self), self.simple_mode, self.get_level(), type(other), other.simple_mode, other.get_level())
+            damage = cache.lookup(key)
+            if damage is None:
+                damage = self.compute_attack_damage(other)
+                cache.store(key, damage)
+        other.set_hp(other.get_hp() - damage)
+
+    def compute_attack_damage(self, other: MonsterBase) -> int:
+        """The damage an attack on other would do, without applying it."""
+        multiplier = EffectivenessCalculator.get_effectiveness(self.get_element_type(), other.get_element_type())
+        return self.compute_damage(self.get_attack(), other.get_defense(), multiplier)
+
+    @staticmethod
+    def compute_damage(attack, defense, multiplier: float) -> int:
+        """
+        The damage dealt by an attack stat against a defense stat, with the
+        type effectiveness multiplier applied and ceiled to an int.
+
+        Shared by `attack` and the batch battle engine so both agree exactly.
+        """
+        if defense < attack / 2:
+            damage = attack - defense
+        elif defense < attack:
+            damage = attack * 5 / 8 - defense / 4
+        else:
+            damage = attack / 4
+        return math.ceil(damage * multiplier)
 
     def ready_to_evolve(self) -> bool:
         """Whether this monster is ready to evolve. See assignment spec for specific logic."""
-        raise NotImplementedError
+        return self.get_evolution() is not None and self.get_level() != self.original_level
 
     def evolve(self) -> MonsterBase:
         """Evolve this monster instance by returning a new instance of a monster class."""
-        raise NotImplementedError
+        evolved = self.get_evolution()(simple_mode=self.simple_mode, level=self.get_level())
+        # The evolved form keeps the amount of damage taken.
+        evolved.set_hp(evolved.get_max_hp() - (self.get_max_hp() - self.get_hp()))
+        return evolved
+
+    @classmethod
+    def has_plain_combat(cls) -> bool:
+        """
+        Whether this class keeps MonsterBase's own attack, alive, get_hp and set_hp.
+        Battle's fast forward and the batch engine can only stand in for monsters that do.
+        """
+        return all(getattr(cls, name) is getattr(MonsterBase, name) for name in ("attack", "alive", "get_hp", "set_hp"))
+
+    @classmethod
+    def get_element_type(cls) -> Element:
+        """The element of this monster as an Element, without parsing get_element() when the factory already did."""
+        if cls.record is not None:
+            return cls.record.element
+        return Element.from_string(cls.get_element())
+
+    def __str__(self) -> str:
+        return f"LV.{self.get_level()} {self.get_name()}, {self.get_hp()}/{self.get_max_hp()} HP"
 
     ### NOTE
     # Below is provided by the factory - classmethods
@@ -4,12 +4,195 @@ Random number generator class. Uses LCG method with some reasonable initialisati
 __author__ = "Jackson Goerner"
 
 import time
+from array import array
 
-class RandomGen():
+from data_structures.referential_array import ArrayR
+
+class RandomStream():
+    """
+    A single seeded stream of random numbers, using the same LCG as RandomGen.
+
+    Unlike RandomGen, any number of streams can exist at once, so separate simulations
+    (or worker processes) can each draw from their own reproducible stream.
+
+    Usage:
+    ```
+    stream = RandomStream(123)
+    stream.randint(1, 10)         # Same as RandomGen.randint(1, 10) after RandomGen.set_seed(123)
+    stream.jump(1000)             # Skip the next 1000 draws in O(log 1000)
+    workers = stream.split(4)     # 4 non-overlapping substreams
+    draws = stream.random_many(5) # The next 5 draws, as an array
+    ```
+    """
+
+    MOD = pow(2, 48)
+    A = 25214903917
+    C = 11
+    # MOD is a power of two, so `x % MOD == x & MASK` for any non-negative x.
+    MASK = MOD - 1
+
+    # Default number of draws reserved for each substream made by split.
+    SPLIT_STRIDE = pow(2, 32)
+
+    def __init__(self, seed=None) -> None:
+        self.set_seed(seed)
+
+    def set_seed(self, seed=None):
+        """Seed all future calls to `random`."""
+        self.seed = time.time_ns() if seed is None else seed
+
+    def random(self):
+        """Returns a random integer from 0 to 2^32-1"""
+        self.seed = (self.A * self.seed + self.C) % self.MOD
+        return self.seed >> 16
+
+    def random_float(self):
+        """Returns a random floating point integer in the range 0 to 1."""
+        return self.random() / (1 << 32)
+
+    def randint(self, lo, hi):
+        """Returns a random integer from `lo` to `hi` inclusive on both ends."""
+        return (self.random() % (hi - lo + 1)) + lo
+
+    def random_chance(self, ratio):
+        """Returns random()/2^32 < ratio"""
+        return self.random_float() < ratio
+
+    def random_choice(self, collection):
+        """Returns a random choice from a collection that supports __getitem__ and __len__"""
+        return collection[self.randint(0, len(collection)-1)]
+
+    def random_shuffle(self, collection, compatible: bool = True) -> None:
+        """
+        Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
+
+        :compatible: When True, produces the same permutation as every previous version,
+            by sorting on one random key per item.
+            When False, does an in place Fisher-Yates shuffle with no extra copies,
+            which gives a different permutation for the same seed.
+        :complexity: O(n log n) when compatible, O(n) otherwise, where n is len(collection).
+        """
+        if not compatible:
+            # Same draws as calling randint(0, i) for each i, with the LCG state kept in locals.
+            seed, a, c, mask = self.seed, self.A, self.C, self.MASK
+            for i in range(len(collection) - 1, 0, -1):
+                seed = (a * seed + c) & mask
+                j = (seed >> 16) % (i + 1)
+                collection[i], collection[j] = collection[j], collection[i]
+            self.seed = seed
+            return
+        keys = self.random_many(len(collection))
+        # Same permutation as sorting (random(), i) pairs: a stable sort keeps ties in index order.
+        positions = sorted(range(len(collection)), key=keys.__getitem__) # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
+        tmp = [collection[p] for p in positions]
+        for x in range(len(collection)):
+            collection[x] = tmp[x]
+
+    def random_many(self, n: int) -> array:
+        """
+        Returns the next n values of `random`, in order, as an array of unsigned ints.
+        :complexity: O(n)
+        """
+        draws = array("Q", bytes(8 * n))
+        seed, a, c, mask = self.seed, self.A, self.C, self.MASK
+        for i in range(n):
+            seed = (a * seed + c) & mask
+            draws[i] = seed >> 16
+        self.seed = seed
+        return draws
+
+    def randint_many(self, lo: int, hi: int, n: int) -> array:
+        """
+        Returns the results of n calls to `randint(lo, hi)`, in order.
+        :complexity: O(n)
+        """
+        draws = array("q", bytes(8 * n))
+        span = hi - lo + 1
+        seed, a, c, mask = self.seed, self.A, self.C, self.MASK
+        for i in range(n):
+            seed = (a * seed + c) & mask
+            draws[i] = (seed >> 16) % span + lo
+        self.seed = seed
+        return draws
+
+    def random_chance_many(self, ratio: float, n: int) -> array:
+        """
+        Returns the results of n calls to `random_chance(ratio)`, in order, as an array of 0/1.
+        :complexity: O(n)
+        """
+        # random() / 2^32 < ratio  <=>  random() < ratio * 2^32, both sides being exact.
+        threshold = ratio * (1 << 32)
+        draws = array("b", bytes(n))
+        seed, a, c, mask = self.seed, self.A, self.C, self.MASK
+        for i in range(n):
+            seed = (a * seed + c) & mask
+            draws[i] = (seed >> 16) < threshold
+        self.seed = seed
+        return draws
+
+    @classmethod
+    def jump_coefficients(cls, n: int) -> tuple[int, int]:
+        """
+        Returns (a, c) such that n steps of the LCG take a seed s to (a * s + c) % MOD.
+
+        Composes the affine step with itself by repeated squaring.
+        :complexity: O(log n)
+        """
+        jump_a, jump_c = 1, 0
+        step_a, step_c = cls.A, cls.C
+        while n > 0:
+            if n & 1:
+                jump_a, jump_c = (step_a * jump_a) % cls.MOD, (step_a * jump_c + step_c) % cls.MOD
+            step_a, step_c = (step_a * step_a) % cls.MOD, (step_a * step_c + step_c) % cls.MOD
+            n >>= 1
+        return jump_a, jump_c
+
+    def jump(self, n: int) -> None:
+        """
+        Advance the stream as if `random` was called n times.
+        :complexity: O(log n)
+        """
+        a, c = self.jump_coefficients(n)
+        self.seed = (a * self.seed + c) % self.MOD
+
+    def split(self, n: int, stride: int = SPLIT_STRIDE) -> ArrayR["RandomStream"]:
+        """
+        Returns n substreams, the i-th starting i * stride draws ahead of this stream.
+        This stream then skips past all of them.
+
+        The substreams do not overlap as long as each makes at most `stride` draws.
+        :complexity: O(n + log(n * stride))
+        """
+        a, c = self.jump_coefficients(stride)
+        streams = ArrayR(n)
+        seed = self.seed
+        for i in range(n):
+            streams[i] = RandomStream(seed)
+            seed = (a * seed + c) % self.MOD
+        self.seed = seed
+        return streams
+
+
+class _RandomGenMeta(type):
+    """Keeps `RandomGen.seed` readable and writable, as it was before the shared stream existed."""
+
+    @property
+    def seed(cls):
+        """The current state of the shared stream."""
+        return cls.stream.seed
+
+    @seed.setter
+    def seed(cls, seed):
+        cls.stream.seed = seed
+
+
+class RandomGen(metaclass=_RandomGenMeta):
     """
     Class used to generate (seeded) random numbers for interesting outcomes and repeatable tests.
 
     Uses LCG method. All methods are O(1) best/worst case time complexity unless stated otherwise.
+    All methods draw from a single shared RandomStream, `RandomGen.stream`,
+    whose state can still be read or assigned as `RandomGen.seed`.
 
     Usage:
     ```
@@ -20,52 +203,61 @@ class RandomGen():
     ```
     """
 
-    MOD = pow(2, 48)
-    A = 25214903917
-    C = 11
+    MOD = RandomStream.MOD
+    A = RandomStream.A
+    C = RandomStream.C
 
-    seed = time.time_ns()
+    stream = RandomStream()
 
     @classmethod
     def set_seed(cls, seed=None):
         """Seed all future calls to `random`."""
-        seed = time.time_ns() if seed is None else seed
-        cls.seed = seed
+        cls.stream.set_seed(seed)
 
     @classmethod
     def random(cls):
         """Returns a random integer from 0 to 2^32-1"""
-        cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
-        return cls.seed >> 16
+        return cls.stream.random()
 
     @classmethod
     def random_float(cls):
         """Returns a random floating point integer in the range 0 to 1."""
-        return cls.random() / (1 << 32)
+        return cls.stream.random_float()
 
     @classmethod
     def randint(cls, lo, hi):
         """Returns a random integer from `lo` to `hi` inclusive on both ends."""
-        return (cls.random() % (hi - lo + 1)) + lo
+        return cls.stream.randint(lo, hi)
 
     @classmethod
     def random_chance(cls, ratio):
         """Returns random()/2^32 < ratio"""
-        return cls.random_float() < ratio
+        return cls.stream.random_chance(ratio)
 
     @classmethod
     def random_choice(cls, collection) -> None:
         """Returns a random choice from a collection that supports __getitem__ and __len__"""
-        return collection[cls.randint(0, len(collection)-1)]
+        return cls.stream.random_choice(collection)
 
     @classmethod
-    def random_shuffle(cls, collection) -> None:
+    def random_many(cls, n):
+        """Returns the next n values of `random` as an array. O(n)"""
+        return cls.stream.random_many(n)
+
+    @classmethod
+    def randint_many(cls, lo, hi, n):
+        """Returns the results of n calls to `randint(lo, hi)` as an array. O(n)"""
+        return cls.stream.randint_many(lo, hi, n)
+
+    @classmethod
+    def random_chance_many(cls, ratio, n):
+        """Returns the results of n calls to `random_chance(ratio)` as an array of 0/1. O(n)"""
+        return cls.stream.random_chance_many(ratio, n)
+
+    @classmethod
+    def random_shuffle(cls, collection, compatible=True) -> None:
         """
         Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
-        :complexity: O(len(collection))
+        See RandomStream.random_shuffle for `compatible`.
         """
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
-        positions.sort() # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
-        tmp = [collection[p[1]] for p in positions]
-        for x in range(len(collection)):
-            collection[x] = tmp[x]
+        cls.stream.random_shuffle(collection, compatible)
@@ -1,6 +1,9 @@
 import abc
+import math
+from array import array
 
 from data_structures.referential_array import ArrayR
+from data_structures.stack_adt import ArrayStack
 
 class Stats(abc.ABC):
 
@@ -24,20 +27,121 @@ class Stats(abc.ABC):
 class SimpleStats(Stats):
 
     def __init__(self, attack, defense, speed, max_hp) -> None:
-        # TODO: Implement
-        pass
+        self.attack = attack
+        self.defense = defense
+        self.speed = speed
+        self.max_hp = max_hp
 
     def get_attack(self):
-        raise NotImplementedError
+        return self.attack
 
     def get_defense(self):
-        raise NotImplementedError
+        return self.defense
 
     def get_speed(self):
-        raise NotImplementedError
+        return self.speed
 
     def get_max_hp(self):
-        raise NotImplementedError
+        return self.max_hp
+
+class Formula:
+    """
+    A postfix stat formula, compiled once into a closure.
+
+    Sub-expressions that do not depend on the level are folded into constants,
+    and results are cached per level, so repeated reads are a single array lookup.
+    """
+
+    CACHED_LEVELS = 64
+
+    BINARY_OPERATORS = {
+        "+": lambda a, b: a + b,
+        "-": lambda a, b: a - b,
+        "*": lambda a, b: a * b,
+        "/": lambda a, b: a / b,
+        "power": lambda a, b: a ** b,
+    }
+
+    def __init__(self, formula: ArrayR[str]) -> None:
+        self.formula = formula
+        self.evaluate = self.compile(formula)
+        self.cache = ArrayR(self.CACHED_LEVELS)
+
+    def __call__(self, level: int):
+        """
+        The value of the formula at the given level.
+
+        :complexity: O(1) once the level is cached, O(n) the first time, where n is the length of the formula.
+        """
+        if 0 <= level < self.CACHED_LEVELS:
+            value = self.cache[level]
+            if value is None:
+                value = self.evaluate(level)
+                self.cache[level] = value
+            return value
+        return self.evaluate(level)
+
+    @classmethod
+    def compile(cls, formula: ArrayR[str]):
+        """
+        Turn a postfix formula into a function of the level.
+
+        Each stack entry is either a constant or a function of the level.
+        :complexity: O(n) best/worst case, where n is the length of the formula.
+        """
+        stack = ArrayStack(len(formula))
+        for i in range(len(formula)):
+            token = formula[i]
+            if token == "level":
+                stack.push(lambda level: level)
+            elif token == "sqrt":
+                stack.push(cls._combine(math.sqrt, stack.pop()))
+            elif token == "middle":
+                c = stack.pop()
+                b = stack.pop()
+                a = stack.pop()
+                stack.push(cls._combine(cls._middle, a, b, c))
+            elif token in cls.BINARY_OPERATORS:
+                b = stack.pop()
+                a = stack.pop()
+                stack.push(cls._combine(cls.BINARY_OPERATORS[token], a, b))
+            else:
+                stack.push(cls._parse_number(token))
+        result = stack.pop()
+        if callable(result):
+            return result
+        return lambda level: result
+
+    @staticmethod
+    def _middle(a, b, c):
+        """The median of three values, returned as is rather than computed, so floats stay exact."""
+        if a > b:
+            a, b = b, a
+        # a <= b, so the median is b unless c is below it.
+        if c >= b:
+            return b
+        return c if c > a else a
+
+    @staticmethod
+    def _combine(operator, *operands):
+        """Apply operator to the operands now if they are all constants, otherwise defer it to a closure."""
+        if not any(callable(operand) for operand in operands):
+            return operator(*operands)
+        functions = tuple(operand if callable(operand) else (lambda level, value=operand: value) for operand in operands)
+        if len(functions) == 1:
+            f, = functions
+            return lambda level: operator(f(level))
+        if len(functions) == 2:
+            f, g = functions
+            return lambda level: operator(f(level), g(level))
+        return lambda level: operator(*(f(level) for f in functions))
+
+    @staticmethod
+    def _parse_number(token: str):
+        try:
+            return int(token)
+        except ValueError:
+            return float(token)
 
 class ComplexStats(Stats):
 
@@ -48,17 +152,65 @@ class ComplexStats(Stats):
         speed_formula: ArrayR[str],
         max_hp_formula: ArrayR[str],
     ) -> None:
-        # TODO: Implement
-        pass
+        self.attack_formula = Formula(attack_formula)
+        self.defense_formula = Formula(defense_formula)
+        self.speed_formula = Formula(speed_formula)
+        self.max_hp_formula = Formula(max_hp_formula)
 
     def get_attack(self, level: int):
-        raise NotImplementedError
+        return self.attack_formula(level)
 
     def get_defense(self, level: int):
-        raise NotImplementedError
+        return self.defense_formula(level)
 
     def get_speed(self, level: int):
-        raise NotImplementedError
+        return self.speed_formula(level)
 
     def get_max_hp(self, level: int):
-        raise NotImplementedError
+        return self.max_hp_formula(level)
+
+
+class StatTable:
+    """
+    The stats of one monster class materialised into a flat array, so instances can read them by index.
+
+    Row 0 holds the simple stats and row L the complex stats at level L, for L in 1..max_level.
+    Each row is (attack, defense, speed, max_hp).
+
+    :raises TypeError: if any stat is not an integer.
+    :raises OverflowError: if any stat does not fit in 64 bits.
+    """
+
+    ATTACK = 0
+    DEFENSE = 1
+    SPEED = 2
+    MAX_HP = 3
+    ROW = 4
+
+    def __init__(self, simple_stats: Stats, complex_stats: Stats, max_level: int) -> None:
+        self.max_level = max_level
+        self.values = array("q", bytes(8 * self.ROW * (max_level + 1)))
+        self.set_row(0, simple_stats.get_attack(), simple_stats.get_defense(), simple_stats.get_speed(), simple_stats.get_max_hp())
+        for level in range(1, max_level + 1):
+            self.set_row(
+                level,
+                complex_stats.get_attack(level),
+                complex_stats.get_defense(level),
+                complex_stats.get_speed(level),
+                complex_stats.get_max_hp(level),
+            )
+
+    def set_row(self, row: int, attack: int, defense: int, speed: int, max_hp: int) -> None:
+        start = row * self.ROW
+        self.values[start + self.ATTACK] = attack
+        self.values[start + self.DEFENSE] = defense
+        self.values[start + self.SPEED] = speed
+        self.values[start + self.MAX_HP] = max_hp
+
+    def row(self, simple_mode: bool, level: int) -> int:
+        """Offset of the row for the given mode and level within values, or -1 if it was not precomputed."""
+        if simple_mode:
+            return 0
+        if 1 <= level <= self.max_level:
+            return level * self.ROW
+        return -1
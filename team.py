@@ -5,9 +5,13 @@ from typing import Optional, TYPE_CHECKING
 from base_enum import BaseEnum
 from monster_base import MonsterBase
 from random_gen import RandomGen
-from helpers import get_all_monsters
+from helpers import get_all_monsters, get_spawnable_monsters
 
 from data_structures.referential_array import ArrayR
+from data_structures.deque_adt import CircularDeque
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.sorted_list_adt import ListItem
+from data_structures.bset import BSet
 
 if TYPE_CHECKING:
     from battle import Battle
@@ -39,6 +43,23 @@ class MonsterTeam:
     def __init__(self, team_mode: TeamMode, selection_mode, **kwargs) -> None:
         # Add any preinit logic here.
         self.team_mode = team_mode
+        self.sort_key = kwargs.pop("sort_key", None)
+        self.descending = True
+        if team_mode in (self.TeamMode.FRONT, self.TeamMode.BACK):
+            # FRONT adds and retrieves at the front, BACK adds at the back and retrieves at the front.
+            self.team = CircularDeque(self.TEAM_LIMIT)
+        elif team_mode == self.TeamMode.OPTIMISE:
+            if self.sort_key is None:
+                raise ValueError("sort_key is required for TeamMode.OPTIMISE.")
+            self.team = ArraySortedList(self.TEAM_LIMIT)
+        else:
+            raise ValueError(f"team_mode {team_mode} not supported.")
+        # The monster classes selected, in selection order, so the team can be regenerated.
+        self.initial_monsters = ArrayR(self.TEAM_LIMIT)
+        self.initial_size = 0
+        # Element values of the selected monsters, kept up to date as they are selected.
+        self.initial_elements = BSet()
+        self.selecting = True
         if selection_mode == self.SelectionMode.RANDOM:
             self.select_randomly(**kwargs)
         elif selection_mode == self.SelectionMode.MANUAL:
@@ -47,39 +68,89 @@ class MonsterTeam:
             self.select_provided(**kwargs)
         else:
             raise ValueError(f"selection_mode {selection_mode} not supported.")
+        self.selecting = False
+
+    def __len__(self) -> int:
+        return len(self.team)
 
     def add_to_team(self, monster: MonsterBase):
-        raise NotImplementedError
+        if self.selecting:
+            if self.initial_size >= self.TEAM_LIMIT:
+                raise ValueError(f"Teams can have at most {self.TEAM_LIMIT} monsters.")
+            self.initial_monsters[self.initial_size] = type(monster)
+            self.initial_size += 1
+            self.initial_elements.add(monster.get_element_type().value)
+        if self.team_mode == self.TeamMode.FRONT:
+            self.team.push_front(monster)
+        elif self.team_mode == self.TeamMode.BACK:
+            self.team.push_back(monster)
+        else:
+            self.team.add(ListItem(monster, self.sort_value(monster)))
 
     def retrieve_from_team(self) -> MonsterBase:
-        raise NotImplementedError
+        if self.team_mode != self.TeamMode.OPTIMISE:
+            return self.team.pop_front()
+        return self.team.delete_at_index(0).value
+
+    def sort_value(self, monster: MonsterBase):
+        """The key a monster is sorted on in TeamMode.OPTIMISE, accounting for the current order."""
+        if self.sort_key == self.SortMode.HP:
+            value = monster.get_hp()
+        elif self.sort_key == self.SortMode.ATTACK:
+            value = monster.get_attack()
+        elif self.sort_key == self.SortMode.DEFENSE:
+            value = monster.get_defense()
+        elif self.sort_key == self.SortMode.SPEED:
+            value = monster.get_speed()
+        elif self.sort_key == self.SortMode.LEVEL:
+            value = monster.get_level()
+        else:
+            raise ValueError(f"sort_key {self.sort_key} not supported.")
+        return -value if self.descending else value
 
     def special(self) -> None:
-        raise NotImplementedError
+        """
+        FRONT: Reverses the first 3 monsters in the team.
+        BACK: Swaps the first and second halves of the team (the middle monster
+            belongs to the second half) and reverses the new first half.
+        OPTIMISE: Toggles between descending and ascending sorting order.
+            Monsters with equal keys keep their relative order.
+
+        :complexity: O(1) for FRONT, O(n) for BACK and O(n log n) for OPTIMISE, where n is the team size.
+            FRONT and BACK work in place.
+        """
+        if self.team_mode == self.TeamMode.FRONT:
+            self.team.reverse(0, min(3, len(self.team)))
+        elif self.team_mode == self.TeamMode.BACK:
+            # Reversing everything gives reversed(second half) + reversed(first half),
+            # then reversing the tail puts the first half back in order.
+            half = len(self.team) // 2
+            self.team.reverse()
+            self.team.reverse(len(self.team) - half)
+        else:
+            self.descending = not self.descending
+            items = ArrayR(len(self.team))
+            for i in range(len(items)):
+                items[i] = ListItem(self.team[i].value, -self.team[i].key)
+            self.team.clear()
+            self.team.add_all(items)
 
     def regenerate_team(self) -> None:
-        raise NotImplementedError
+        """Restores the team to its originally selected monsters, at full health and in their original order."""
+        self.team.clear()
+        self.descending = True
+        for i in range(self.initial_size):
+            self.add_to_team(self.initial_monsters[i]())
 
     def select_randomly(self):
         team_size = RandomGen.randint(1, self.TEAM_LIMIT)
-        monsters = get_all_monsters()
-        n_spawnable = 0
-        for x in range(len(monsters)):
-            if monsters[x].can_be_spawned():
-                n_spawnable += 1
+        spawnable = get_spawnable_monsters()
+        if len(spawnable) == 0:
+            raise ValueError("Spawning logic failed.")
 
         for _ in range(team_size):
-            spawner_index = RandomGen.randint(0, n_spawnable-1)
-            cur_index = -1
-            for x in range(len(monsters)):
-                if monsters[x].can_be_spawned():
-                    cur_index += 1
-                    if cur_index == spawner_index:
-                        # Spawn this monster
-                        self.add_to_team(monsters[x]())
-                        break
-            else:
-                raise ValueError("Spawning logic failed.")
+            spawner_index = RandomGen.randint(0, len(spawnable)-1)
+            self.add_to_team(spawnable[spawner_index]())
 
     def select_manually(self):
         """
@@ -186,7 +257,27 @@ class MonsterTeam:
         This monster cannot be spawned.
         Which monster are you spawning? 1
         """
-        raise NotImplementedError
+        while True:
+            team_size = input("How many monsters are there? ")
+            if team_size.isdigit() and 1 <= int(team_size) <= self.TEAM_LIMIT:
+                team_size = int(team_size)
+                break
+        monsters = get_all_monsters()
+        for _ in range(team_size):
+            print("MONSTERS Are:")
+            for x in range(len(monsters)):
+                spawnable = "✔️" if monsters[x].can_be_spawned() else "❌"
+                print(f"{x+1}: {monsters[x].get_name()} [{spawnable}]")
+            while True:
+                choice = input("Which monster are you spawning? ")
+                if not choice.isdigit() or not 1 <= int(choice) <= len(monsters):
+                    continue
+                monster = monsters[int(choice)-1]
+                if not monster.can_be_spawned():
+                    print("This monster cannot be spawned.")
+                    continue
+                self.add_to_team(monster())
+                break
 
     def select_provided(self, provided_monsters:Optional[ArrayR[type[MonsterBase]]]=None):
         """
@@ -201,7 +292,15 @@ class MonsterTeam:
         Example team if in TeamMode.FRONT:
         [Gustwing Instance, Aquariuma Instance, Flamikin Instance]
         """
-        raise NotImplementedError
+        if provided_monsters is None:
+            raise ValueError("provided_monsters must be given.")
+        if len(provided_monsters) > self.TEAM_LIMIT:
+            raise ValueError(f"Teams can have at most {self.TEAM_LIMIT} monsters.")
+        for x in range(len(provided_monsters)):
+            if not provided_monsters[x].can_be_spawned():
+                raise ValueError(f"{provided_monsters[x].get_name()} cannot be spawned.")
+        for x in range(len(provided_monsters)):
+            self.add_to_team(provided_monsters[x]())
 
     def choose_action(self, currently_out: MonsterBase, enemy: MonsterBase) -> Battle.Action:
         # This is just a placeholder function that doesn't matter much for testing.
@@ -0,0 +1,95 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+from random_gen import RandomGen
+
+from battle import Battle
+from batch_battle import BatchBattle
+from team import MonsterTeam
+from helpers import Flamikin, Aquariuma, Vineon, Strikeon
+
+from data_structures.referential_array import ArrayR
+
+class TestBatchBattle(TestCase):
+
+    def make_teams(self, seed: int, n: int) -> ArrayR[MonsterTeam]:
+        RandomGen.set_seed(seed)
+        modes = [MonsterTeam.TeamMode.FRONT, MonsterTeam.TeamMode.BACK, MonsterTeam.TeamMode.OPTIMISE]
+        teams = ArrayR(n)
+        for i in range(n):
+            teams[i] = MonsterTeam(
+                team_mode=modes[i % 3],
+                selection_mode=MonsterTeam.SelectionMode.RANDOM,
+                sort_key=MonsterTeam.SortMode.SPEED,
+            )
+        return teams
+
+    @number("4.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_matches_scalar(self):
+        n = 60
+        batch_teams = self.make_teams(2023, 2 * n)
+        scalar_teams = self.make_teams(2023, 2 * n)
+        teams1 = ArrayR(n)
+        teams2 = ArrayR(n)
+        for i in range(n):
+            teams1[i] = batch_teams[2 * i]
+            teams2[i] = batch_teams[2 * i + 1]
+        results = BatchBattle().battle_all(teams1, teams2)
+        for i in range(n):
+            expected = Battle().battle(scalar_teams[2 * i], scalar_teams[2 * i + 1])
+            self.assertEqual(results[i], expected, f"Battle #{i} differs from Battle.battle")
+
+    @number("4.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_always_attack(self):
+        def make_team(team_mode):
+            team = MonsterTeam(
+                team_mode=team_mode,
+                selection_mode=MonsterTeam.SelectionMode.PROVIDED,
+                provided_monsters=ArrayR.from_list([Flamikin, Aquariuma, Vineon, Strikeon]),
+            )
+            team.choose_action = lambda out, enemy: Battle.Action.ATTACK
+            return team
+        results = BatchBattle().battle_all(
+            ArrayR.from_list([make_team(MonsterTeam.TeamMode.BACK), make_team(MonsterTeam.TeamMode.FRONT)]),
+            ArrayR.from_list([make_team(MonsterTeam.TeamMode.FRONT), make_team(MonsterTeam.TeamMode.BACK)]),
+        )
+        self.assertEqual(results[0], Battle.Result.TEAM1)
+        self.assertEqual(results[1], Battle.Result.TEAM2)
+
+    @number("4.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_custom_monsters_and_complex_stats(self):
+        class HeavyStrikeon(Strikeon):
+            # Overrides attack, so the batch engine has to run its turns on the objects.
+            def attack(self, other):
+                other.set_hp(other.get_hp() - 3)
+
+        def make_teams():
+            teams = ArrayR(6)
+            for i in range(6):
+                team = MonsterTeam(
+                    team_mode=[MonsterTeam.TeamMode.FRONT, MonsterTeam.TeamMode.BACK][i % 2],
+                    selection_mode=MonsterTeam.SelectionMode.PROVIDED,
+                    provided_monsters=ArrayR.from_list([Flamikin, HeavyStrikeon, Aquariuma, Vineon][i % 3:]),
+                )
+                # Complex stats, above the starting level.
+                for _ in range(len(team)):
+                    team.add_to_team(type(team.retrieve_from_team())(simple_mode=False, level=3))
+                teams[i] = team
+            return teams
+
+        batch_teams = make_teams()
+        scalar_teams = make_teams()
+        results = BatchBattle().battle_all(
+            ArrayR.from_list([batch_teams[0], batch_teams[2], batch_teams[4]]),
+            ArrayR.from_list([batch_teams[1], batch_teams[3], batch_teams[5]]),
+        )
+        for i in range(3):
+            expected = Battle().battle(scalar_teams[2 * i], scalar_teams[2 * i + 1])
+            self.assertEqual(results[i], expected, f"Battle #{i} differs from Battle.battle")
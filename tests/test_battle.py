@@ -4,6 +4,7 @@ from ed_utils.decorators import number, visibility
 from ed_utils.timeout import timeout
 
 from battle import Battle
+from random_gen import RandomGen
 from team import MonsterTeam
 from helpers import Flamikin, Aquariuma, Vineon, Strikeon, Normake, Marititan, Leviatitan, Treetower, Infernoth
 
@@ -133,3 +134,47 @@ class TestBattle(TestCase):
         ]
         res = b.battle(team1, team2)
         self.assertEqual(res, Battle.Result.DRAW)
+
+    @number("4.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_fast_forward(self):
+        class CountingBattle(Battle):
+            skipped = 0
+
+            def fast_forward_exchange(self):
+                turns = Battle.fast_forward_exchange(self)
+                CountingBattle.skipped += turns
+                return turns
+
+        def play(battle: Battle, seed: int):
+            RandomGen.set_seed(seed)
+            team1 = MonsterTeam(MonsterTeam.TeamMode.FRONT, MonsterTeam.SelectionMode.RANDOM)
+            team2 = MonsterTeam(MonsterTeam.TeamMode.OPTIMISE, MonsterTeam.SelectionMode.RANDOM, sort_key=MonsterTeam.SortMode.HP)
+            result = battle.battle(team1, team2)
+            return result, battle.turn_number, str(battle.out1), str(battle.out2)
+
+        for seed in range(40):
+            expected = play(Battle(verbosity=0), seed)
+            self.assertEqual(play(CountingBattle(verbosity=0, fast_forward=True), seed), expected)
+            self.assertEqual(play(Battle(verbosity=0, fast_forward=True, verify_fast_forward=True), seed), expected)
+        self.assertGreater(CountingBattle.skipped, 0)
+
+    @number("4.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_fast_forward_custom_alive(self):
+        class FragileVineon(Vineon):
+            def alive(self):
+                return self.get_hp() * 3 > self.get_max_hp()
+
+        def play(battle: Battle, opponent):
+            team1 = MonsterTeam(MonsterTeam.TeamMode.FRONT, MonsterTeam.SelectionMode.PROVIDED, provided_monsters=ArrayR.from_list([FragileVineon]))
+            team2 = MonsterTeam(MonsterTeam.TeamMode.FRONT, MonsterTeam.SelectionMode.PROVIDED, provided_monsters=ArrayR.from_list([opponent]))
+            result = battle.battle(team1, team2)
+            return result, battle.turn_number, str(battle.out1), str(battle.out2)
+
+        for opponent in [Flamikin, Aquariuma, Strikeon]:
+            expected = play(Battle(verbosity=0), opponent)
+            self.assertEqual(play(Battle(verbosity=0, fast_forward=True), opponent), expected)
+            self.assertEqual(play(Battle(verbosity=0, fast_forward=True, verify_fast_forward=True), opponent), expected)
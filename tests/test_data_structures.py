@@ -0,0 +1,328 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from random_gen import RandomStream
+
+from data_structures.referential_array import ArrayR
+from data_structures.typed_array import ArrayI, ArrayF
+from data_structures.array_sorted_list import ArraySortedList
+from data_structures.avl_sorted_list import AVLSortedList
+from data_structures.sorted_list_adt import ListItem
+from data_structures.sorting import merge_sort, top_k
+from data_structures.bset import BSet
+from data_structures.queue_adt import GrowableCircularQueue
+from data_structures.stack_adt import GrowableArrayStack
+from data_structures.deque_adt import CircularDeque
+from elements import Element
+
+class TestArrayR(TestCase):
+
+    @number("7.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_bulk_operations(self):
+        a = ArrayR.from_list(list(range(10)))
+        self.assertListEqual(a.get_slice(2, 5).to_list(), [2, 3, 4])
+        self.assertEqual(len(a.get_slice(10, 10)), 0)
+        for start, stop in [(-1, 3), (5, 2), (8, 11)]:
+            self.assertRaises(IndexError, lambda: a.get_slice(start, stop))
+        a.set_slice(7, ArrayR.from_list(["a", "b", "c"]))
+        self.assertListEqual(a.to_list(), [0, 1, 2, 3, 4, 5, 6, "a", "b", "c"])
+        self.assertRaises(IndexError, lambda: a.set_slice(8, [1, 2, 3]))
+        self.assertRaises(IndexError, lambda: a.set_slice(-1, [1]))
+        for start, stop in [(-1, 3), (5, 2), (8, 11)]:
+            self.assertRaises(IndexError, lambda: a.fill(None, start, stop))
+
+        # Overlapping copies within the same array, in both directions.
+        a.copy_from(a, 0, 1, 4)
+        self.assertListEqual(a.to_list()[:5], [0, 0, 1, 2, 3])
+        a.copy_from(a, 1, 0, 4)
+        self.assertListEqual(a.to_list()[:5], [0, 1, 2, 3, 3])
+
+        a.fill(None, 5)
+        self.assertListEqual(a.to_list(), [0, 1, 2, 3, 3, None, None, None, None, None])
+
+    @number("7.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_view(self):
+        a = ArrayR.from_list(list(range(10)))
+        v = a.view(3, 6)
+        self.assertEqual(len(v), 3)
+        self.assertListEqual(v.to_list(), [3, 4, 5])
+        v[0] = "x"
+        self.assertEqual(a[3], "x")
+        self.assertRaises(IndexError, lambda: v[3])
+        self.assertRaises(IndexError, lambda: a.view(5, 11))
+
+
+class TestTypedArray(TestCase):
+
+    @number("7.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_same_interface_as_array_r(self):
+        a = ArrayI(5)
+        self.assertListEqual(a.to_list(), [0, 0, 0, 0, 0])
+        for i in range(len(a)):
+            a[i] = i * 10
+        self.assertEqual(a[3], 30)
+        self.assertEqual(a.index(20), 2)
+        self.assertRaises(ValueError, lambda: a.index(7))
+        a.copy_from(a, 0, 1, 4)
+        self.assertListEqual(a.to_list(), [0, 0, 10, 20, 30])
+        a.set_slice(3, [7, 8])
+        a.fill(-1, 0, 2)
+        self.assertListEqual(a.to_list(), [-1, -1, 10, 7, 8])
+        self.assertListEqual(a.get_slice(1, 4).to_list(), [-1, 10, 7])
+        self.assertRaises(IndexError, lambda: a.get_slice(3, 6))
+        self.assertListEqual(a.view(2).to_list(), [10, 7, 8])
+        self.assertRaises(TypeError, lambda: a.__setitem__(0, 1.5))
+        # Bad bounds are rejected rather than changing the length of the array.
+        for bad in [lambda: a.fill(7, 0, 6), lambda: a.fill(5, -1), lambda: a.fill(5, 3, 2), lambda: a.set_slice(-1, [9]), lambda: a.set_slice(4, [1, 2])]:
+            self.assertRaises(IndexError, bad)
+        self.assertEqual(len(a), 5)
+        a.fill(0, 5)
+        self.assertListEqual(a.to_list(), [-1, -1, 10, 7, 8])
+
+        f = ArrayF.from_list([0.5, 1.5])
+        f[1] += 1
+        self.assertListEqual(f.to_list(), [0.5, 2.5])
+        self.assertEqual(f.memoryview().format, "d")
+        self.assertEqual(f.memoryview().nbytes, 16)
+
+
+class TestArraySortedList(TestCase):
+
+    @number("7.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_add_and_delete(self):
+        sl = ArraySortedList(1)
+        for key in [5, 1, 4, 2, 3, 0, 9]:
+            sl.add(ListItem(str(key), key))
+        self.assertListEqual([sl[i].key for i in range(len(sl))], [0, 1, 2, 3, 4, 5, 9])
+        sl.delete_at_index(0)
+        sl.delete_at_index(3)
+        sl.delete_at_index(len(sl) - 1)
+        self.assertListEqual([sl[i].key for i in range(len(sl))], [1, 2, 3, 5])
+
+    @number("7.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_add_all(self):
+        sl = ArraySortedList(1)
+        for key in [2, 6, 4]:
+            sl.add(ListItem("old", key))
+        sl.add_all(ArrayR.from_list([ListItem("new" + str(key), key) for key in [7, 4, 1, 4, 9, 3, 6]]))
+        self.assertEqual(len(sl), 10)
+        self.assertListEqual(
+            [(sl[i].value, sl[i].key) for i in range(len(sl))],
+            [("new1", 1), ("old", 2), ("new3", 3), ("old", 4), ("new4", 4), ("new4", 4),
+             ("old", 6), ("new6", 6), ("new7", 7), ("new9", 9)],
+        )
+        # The list still works as usual afterwards.
+        sl.add(ListItem("x", 5))
+        self.assertEqual(sl[6].key, 5)
+        sl.add_all([])
+        self.assertEqual(len(sl), 11)
+
+
+class TestAVLSortedList(TestCase):
+
+    @number("7.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_matches_reference(self):
+        stream = RandomStream(12345)
+        sl = AVLSortedList()
+        reference = []
+        for _ in range(500):
+            if len(reference) > 0 and stream.random_chance(0.3):
+                index = stream.randint(0, len(reference) - 1)
+                self.assertIs(sl.delete_at_index(index), reference.pop(index))
+            else:
+                item = ListItem("x", stream.randint(0, 50))
+                sl.add(item)
+                # New items go after those with an equal key.
+                pos = len(reference)
+                while pos > 0 and reference[pos - 1].key > item.key:
+                    pos -= 1
+                reference.insert(pos, item)
+            self.assertEqual(len(sl), len(reference))
+        self.assertListEqual(list(sl), reference)
+        for i in range(len(reference)):
+            self.assertIs(sl[i], reference[i])
+            self.assertEqual(sl.index(reference[i]), i)
+        self.assertNotIn(ListItem("x", 3), sl)
+        self.assertRaises(IndexError, lambda: sl.delete_at_index(len(sl)))
+
+    @number("7.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_update_key(self):
+        sl = AVLSortedList()
+        items = [ListItem(name, lives) for name, lives in [("a", 3), ("b", 5), ("c", 1), ("d", 4)]]
+        sl.add_all(items)
+        self.assertListEqual([item.value for item in sl], ["c", "a", "d", "b"])
+        sl.update_key(items[1], 0)
+        sl.update_key(items[2], 4)
+        self.assertListEqual([item.value for item in sl], ["b", "a", "d", "c"])
+        self.assertListEqual([item.key for item in sl], [0, 3, 4, 4])
+        sl[1] = ListItem("e", 2)
+        self.assertRaises(IndexError, lambda: sl.__setitem__(0, ListItem("f", 9)))
+        self.assertEqual(str(sl), "[(b, 0), (e, 2), (a, 3), (d, 4), (c, 4)]")
+        sl.clear()
+        self.assertTrue(sl.is_empty())
+        self.assertListEqual(list(sl), [])
+
+
+class TestSorting(TestCase):
+
+    @number("7.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_merge_sort(self):
+        stream = RandomStream(7)
+        for n in [0, 1, 2, 15, 16, 17, 100, 333]:
+            pairs = [(stream.randint(0, 20), i) for i in range(n)]
+            a = ArrayR.from_list(pairs)
+            merge_sort(a, key=lambda pair: pair[0])
+            # Stable: equal keys stay in index order.
+            self.assertListEqual(a.to_list(), sorted(pairs))
+
+        a = ArrayR.from_list([5, 4, 3, 2, 1])
+        merge_sort(a, start=1, stop=4)
+        self.assertListEqual(a.to_list(), [5, 2, 3, 4, 1])
+
+    @number("7.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_top_k(self):
+        stream = RandomStream(8)
+        pairs = [(stream.randint(0, 20), i) for i in range(200)]
+        a = ArrayR.from_list(pairs)
+        for k in [0, 1, 5, 50, 200, 300]:
+            self.assertListEqual(top_k(a, k, key=lambda pair: pair[0]).to_list(), sorted(pairs)[:k])
+        self.assertListEqual(top_k(a, 3, key=lambda pair: -pair[0]).to_list(),
+                             sorted(pairs, key=lambda pair: -pair[0])[:3])
+        # The input is left alone.
+        self.assertListEqual(a.to_list(), pairs)
+
+
+class TestBSet(TestCase):
+
+    @number("7.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_bulk_operations(self):
+        s = BSet.from_iterable([3, 1, 70, 3])
+        self.assertEqual(len(s), 3)
+        self.assertListEqual(list(s), [1, 3, 70])
+        t = BSet.from_iterable(ArrayR.from_list([Element.WATER, Element.FIRE]))
+        self.assertListEqual(list(t), sorted([Element.WATER.value, Element.FIRE.value]))
+        self.assertRaises(TypeError, lambda: BSet.from_iterable([0]))
+        self.assertEqual(len(BSet()), 0)
+
+        before = s
+        s |= BSet.from_iterable([2, 3])
+        self.assertIs(s, before)
+        self.assertListEqual(list(s), [1, 2, 3, 70])
+        s -= BSet.from_iterable([1, 70])
+        self.assertListEqual(list(s), [2, 3])
+        s &= BSet.from_iterable([3, 4])
+        self.assertIs(s, before)
+        self.assertListEqual(list(s), [3])
+        self.assertListEqual(list(BSet.from_bits(0b101) - BSet.from_bits(0b1)), [3])
+
+
+class TestGrowable(TestCase):
+
+    @number("7.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_queue(self):
+        stream = RandomStream(99)
+        queue = GrowableCircularQueue()
+        reference = []
+        for step in range(2000):
+            # Mostly appends for the first half, mostly serves for the second.
+            append_ratio = 0.8 if step < 1000 else 0.2
+            if len(reference) == 0 or stream.random_chance(append_ratio):
+                queue.append(step)
+                reference.append(step)
+            else:
+                self.assertEqual(queue.serve(), reference.pop(0))
+            self.assertEqual(len(queue), len(reference))
+            self.assertFalse(queue.is_full())
+            self.assertLessEqual(len(queue.array), max(1, 4 * len(reference)))
+            if len(reference) > 0:
+                self.assertEqual(queue.peek(), reference[0])
+        while reference:
+            self.assertEqual(queue.serve(), reference.pop(0))
+        self.assertEqual(len(queue.array), 1)
+        self.assertRaises(Exception, queue.serve)
+
+    @number("7.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_stack(self):
+        stack = GrowableArrayStack(4)
+        for i in range(100):
+            stack.push(i)
+        self.assertEqual(len(stack.array), 128)
+        for i in range(99, 9, -1):
+            self.assertEqual(stack.pop(), i)
+        self.assertLessEqual(len(stack.array), 40)
+        self.assertEqual(stack.peek(), 9)
+        stack.clear()
+        self.assertEqual(len(stack.array), 4)
+        self.assertTrue(stack.is_empty())
+
+
+class TestCircularDeque(TestCase):
+
+    @number("7.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_both_ends(self):
+        stream = RandomStream(5)
+        deque = CircularDeque(8)
+        reference = []
+        for step in range(500):
+            choice = stream.randint(0, 3)
+            if choice == 0 and len(reference) < 8:
+                deque.push_front(step)
+                reference.insert(0, step)
+            elif choice == 1 and len(reference) < 8:
+                deque.push_back(step)
+                reference.append(step)
+            elif choice == 2 and len(reference) > 0:
+                self.assertEqual(deque.pop_front(), reference.pop(0))
+            elif choice == 3 and len(reference) > 0:
+                self.assertEqual(deque.pop_back(), reference.pop())
+            self.assertListEqual([deque[i] for i in range(len(deque))], reference)
+            self.assertEqual(deque.is_full(), len(reference) == 8)
+        self.assertRaises(IndexError, lambda: deque[len(reference)])
+
+    @number("7.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_reverse(self):
+        deque = CircularDeque(6)
+        for i in range(4):
+            deque.push_back(i)
+        deque.push_front(-1)
+        deque.push_front(-2)
+        # The elements now wrap around the end of the array.
+        deque.reverse(0, 3)
+        self.assertListEqual([deque[i] for i in range(6)], [0, -1, -2, 1, 2, 3])
+        deque.reverse(2)
+        self.assertListEqual([deque[i] for i in range(6)], [0, -1, 3, 2, 1, -2])
+        deque.reverse()
+        self.assertListEqual([deque[i] for i in range(6)], [-2, 1, 2, 3, -1, 0])
+        self.assertEqual(deque.peek_front(), -2)
+        self.assertEqual(deque.peek_back(), 0)
+        self.assertRaises(IndexError, lambda: deque.reverse(3, 7))
@@ -5,6 +5,8 @@ from ed_utils.timeout import timeout
 
 from elements import EffectivenessCalculator, Element
 
+from data_structures.referential_array import ArrayR
+
 class TestElementEffectiveness(TestCase):
 
     @number("2.1")
@@ -16,3 +18,39 @@ class TestElementEffectiveness(TestCase):
         self.assertEqual(EffectivenessCalculator.get_effectiveness(Element.NORMAL, Element.GHOST), 0)
         self.assertEqual(EffectivenessCalculator.get_effectiveness(Element.DRAGON, Element.DRAGON), 2)
         self.assertEqual(EffectivenessCalculator.get_effectiveness(Element.WATER, Element.GRASS), 0.5)
+
+    @number("2.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_effectiveness_many(self):
+        attackers = ArrayR.from_list([Element.FIRE, Element.NORMAL, Element.DRAGON])
+        defenders = ArrayR.from_list([Element.WATER, Element.GHOST, Element.DRAGON])
+        self.assertListEqual(EffectivenessCalculator.get_effectiveness_many(attackers, defenders).to_list(), [0.5, 0, 2])
+
+    @number("2.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_header_order(self):
+        calculator = EffectivenessCalculator(
+            ArrayR.from_list(["Grass", "Fire"]),
+            ArrayR.from_list([0.5, 0.5, 2, 1]),
+        )
+        self.assertEqual(calculator.table[(Element.FIRE.value - 1) * len(Element) + Element.GRASS.value - 1], 2)
+        self.assertEqual(calculator.table[(Element.GRASS.value - 1) * len(Element) + Element.FIRE.value - 1], 0.5)
+
+    @number("2.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_from_string_and_hashing(self):
+        for spelling in ["Psychic", "psychic", "PSYCHIC", "pSyChIc"]:
+            self.assertIs(Element.from_string(spelling), Element.PSYCHIC)
+        self.assertRaises(ValueError, lambda: Element.from_string("Plasma"))
+
+        # Equal members hash equally, so they can be used in sets and as dict keys.
+        counts = {}
+        for name in ["Fire", "Water", "fire"]:
+            element = Element.from_string(name)
+            counts[element] = counts.get(element, 0) + 1
+        self.assertEqual(counts, {Element.FIRE: 2, Element.WATER: 1})
+        self.assertIn(Element.ICE, {Element.ICE, Element.DARK})
+        self.assertNotEqual(Element.ICE, Element.DARK)
@@ -0,0 +1,84 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase, mock
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+import helpers
+
+class TestRosterCache(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.yaml_path = os.path.join(self.directory, "monsters.yaml")
+        shutil.copy("monsters.yaml", self.yaml_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @number("1.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_cache_used_when_fresh(self):
+        roster = helpers.load_roster(self.yaml_path)
+        self.assertTrue(os.path.exists(helpers.roster_cache_path(self.yaml_path)))
+        with mock.patch("yaml.load", side_effect=AssertionError("YAML parsed despite fresh cache")):
+            self.assertEqual(helpers.load_roster(self.yaml_path), roster)
+            # Touching the file without changing it keeps the cache valid.
+            os.utime(self.yaml_path, ns=(0, 0))
+            self.assertEqual(helpers.load_roster(self.yaml_path), roster)
+
+    @number("1.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_cache_invalidated_on_change(self):
+        helpers.load_roster(self.yaml_path)
+        with open(self.yaml_path, "w") as f:
+            f.write("- name: Solo\n")
+        self.assertEqual(helpers.load_roster(self.yaml_path), [{"name": "Solo"}])
+
+    @number("1.13")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_uncacheable_roster(self):
+        # Dates parse fine, but marshal cannot store them.
+        with open(self.yaml_path, "w") as f:
+            f.write("- name: Solo\n  born: 2023-01-01\n")
+        roster = helpers.load_roster(self.yaml_path)
+        self.assertEqual(roster[0]["name"], "Solo")
+        self.assertListEqual(os.listdir(os.path.join(self.directory, "__pycache__")), [])
+
+class TestLazyRoster(TestCase):
+
+    @number("1.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_lazy_classes_are_shared(self):
+        from helpers import Flamikin, Infernoth
+        self.assertIs(Flamikin.get_evolution(), Infernoth)
+        monsters = helpers.get_all_monsters()
+        self.assertEqual(len(monsters), 41)
+        self.assertIs(monsters[0], Flamikin)
+        for i in range(len(monsters)):
+            self.assertIs(getattr(helpers, monsters[i].get_name()), monsters[i])
+        self.assertRaises(AttributeError, lambda: helpers.NotAMonster)
+
+    @number("1.14")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_unknown_names_outside_repo(self):
+        directory = tempfile.mkdtemp()
+        cwd = os.getcwd()
+        os.chdir(directory)
+        try:
+            with mock.patch.object(helpers, "_roster_by_name", None):
+                with mock.patch("helpers.load_roster", side_effect=AssertionError("roster read for a non-monster name")):
+                    self.assertFalse(hasattr(helpers, "not_a_monster"))
+                # Without monsters.yaml around, monster-like names are just missing attributes.
+                self.assertFalse(hasattr(helpers, "Flamikinn"))
+                self.assertIsNone(helpers._roster_by_name)
+        finally:
+            os.chdir(cwd)
+            shutil.rmtree(directory)
@@ -1,12 +1,21 @@
-from unittest import TestCase
+import pickle
+from unittest import TestCase, mock
 
 from ed_utils.decorators import number, visibility
 from ed_utils.timeout import timeout
 
-from monster_base import MonsterBase
+from monster_base import MonsterBase, DamageCache
+from battle import Battle
+from random_gen import RandomGen
+from team import MonsterTeam
+from tower import BattleTower
+from elements import Element
+from stats import ComplexStats
 # These classes inherit from MonsterBase,
 # but you don't need to implement them explicitly.
-from helpers import Infernox, Ironclad, Metalhorn
+from helpers import Infernox, Ironclad, Metalhorn, get_all_monsters, precompute_stat_tables
+
+from data_structures.referential_array import ArrayR
 
 class TestMonsters(TestCase):
 
@@ -72,3 +81,97 @@ class TestMonsters(TestCase):
         self.assertEqual(t.get_max_hp(), 14)
         self.assertEqual(t.get_hp(), 12)
 
+
+    @number("1.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_precomputed_stats(self):
+        precompute_stat_tables(max_level=5)
+        try:
+            for simple_mode in [True, False]:
+                t:MonsterBase = Metalhorn(simple_mode=simple_mode, level=4)
+                self.assertGreaterEqual(t.stat_row, 0)
+                stats = t.get_simple_stats() if simple_mode else t.get_complex_stats()
+                for _ in range(3):
+                    args = () if simple_mode else (t.get_level(),)
+                    self.assertEqual(t.get_attack(), stats.get_attack(*args))
+                    self.assertEqual(t.get_defense(), stats.get_defense(*args))
+                    self.assertEqual(t.get_speed(), stats.get_speed(*args))
+                    self.assertEqual(t.get_max_hp(), stats.get_max_hp(*args))
+                    t.level_up()
+            # Past max_level, stats are computed on demand again.
+            self.assertEqual(t.stat_row, -1)
+            self.assertEqual(t.get_max_hp(), t.get_complex_stats().get_max_hp(7))
+
+            # Replacing the tables does not affect monsters that already exist.
+            precompute_stat_tables(max_level=100)
+            big:MonsterBase = Metalhorn(simple_mode=False, level=50)
+            precompute_stat_tables(max_level=5)
+            self.assertEqual(big.get_attack(), big.get_complex_stats().get_attack(50))
+            big.level_up()
+            self.assertEqual(big.get_attack(), big.get_complex_stats().get_attack(51))
+
+            # Stats too large for the table are computed on demand as well.
+            huge = ComplexStats(*(ArrayR.from_list(["level", "10", "power"]) for _ in range(4)))
+            with mock.patch.object(Metalhorn, "get_complex_stats", return_value=huge):
+                precompute_stat_tables(max_level=100)
+                self.assertIsNone(Metalhorn.stat_table)
+                self.assertEqual(Metalhorn(simple_mode=False, level=30).get_attack(), 30 ** 10)
+        finally:
+            monsters = get_all_monsters()
+            for i in range(len(monsters)):
+                monsters[i].stat_table = None
+
+    @number("1.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_slotted_instances(self):
+        t:MonsterBase = Ironclad(simple_mode=False, level=3)
+        self.assertFalse(hasattr(t, "__dict__"))
+        self.assertRaises(AttributeError, lambda: setattr(t, "nickname", "Clanky"))
+        t.set_hp(1)
+        copy = pickle.loads(pickle.dumps(t))
+        self.assertIsInstance(copy, Ironclad)
+        self.assertEqual((copy.get_level(), copy.get_hp(), copy.simple_mode), (3, 1, False))
+
+    @number("1.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_shared_record(self):
+        self.assertIs(Metalhorn().record, Metalhorn.record)
+        self.assertEqual(Metalhorn.get_element_type(), Element.from_string(Metalhorn.get_element()))
+        self.assertIs(Metalhorn.get_simple_stats(), Metalhorn.record.simple_stats)
+        # The evolution is resolved once, then shared.
+        self.assertIs(Metalhorn.get_evolution(), Ironclad)
+        self.assertIs(Metalhorn.record.evolution, Ironclad)
+        self.assertIsNone(Infernox.get_evolution())
+
+    @number("1.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_damage_cache(self):
+        def play_tower():
+            RandomGen.set_seed(2023)
+            bt = BattleTower(Battle(verbosity=0))
+            bt.set_my_team(MonsterTeam(MonsterTeam.TeamMode.OPTIMISE, MonsterTeam.SelectionMode.RANDOM, sort_key=MonsterTeam.SortMode.HP))
+            bt.generate_teams(5)
+            return [(result, l1, l2) for result, _, _, l1, l2 in bt]
+
+        expected = play_tower()
+        MonsterBase.damage_cache = DamageCache(64)
+        try:
+            self.assertListEqual(play_tower(), expected)
+            cache = MonsterBase.damage_cache
+            self.assertEqual(cache.capacity, 64)
+            self.assertEqual(DamageCache(100).capacity, 128)
+            # Types hash by id, so which keys collide (and how many hits that leaves) varies between runs.
+            self.assertGreater(cache.misses, 0)
+
+            a, b = Metalhorn(level=2), Ironclad(level=3)
+            cache.clear()
+            a.attack(b)
+            a.attack(b)
+            self.assertEqual((cache.hits, cache.misses), (1, 1))
+            self.assertEqual(b.get_hp(), b.get_max_hp() - 2 * a.compute_attack_damage(b))
+        finally:
+            MonsterBase.damage_cache = None
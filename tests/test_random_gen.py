@@ -0,0 +1,116 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+from random_gen import RandomGen, RandomStream
+
+from data_structures.referential_array import ArrayR
+
+class TestRandomStream(TestCase):
+
+    @number("6.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_matches_random_gen(self):
+        stream = RandomStream(123456789)
+        RandomGen.set_seed(123456789)
+        for _ in range(100):
+            self.assertEqual(stream.randint(1, 6), RandomGen.randint(1, 6))
+
+    @number("6.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_jump(self):
+        stepped = RandomStream(42)
+        for _ in range(1000):
+            stepped.random()
+        jumped = RandomStream(42)
+        jumped.jump(1000)
+        self.assertEqual(jumped.seed, stepped.seed)
+        self.assertEqual(jumped.random(), stepped.random())
+
+    @number("6.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_split(self):
+        stream = RandomStream(42)
+        reference = RandomStream(42).random_many(30)
+        streams = stream.split(3, stride=10)
+        for i in range(3):
+            self.assertListEqual(streams[i].random_many(10).tolist(), reference[10 * i:10 * (i + 1)].tolist())
+        # The parent continues after every substream.
+        after = RandomStream(42)
+        after.jump(30)
+        self.assertEqual(stream.random(), after.random())
+
+    @number("6.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_random_many(self):
+        stream = RandomStream(7)
+        single = RandomStream(7)
+        expected = [single.random() for _ in range(50)]
+        self.assertListEqual(stream.random_many(50).tolist(), expected)
+        self.assertEqual(stream.seed, single.seed)
+
+    @number("6.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_bulk_draws(self):
+        single = RandomStream(99)
+        bulk = RandomStream(99)
+        self.assertListEqual(bulk.randint_many(3, 17, 200).tolist(), [single.randint(3, 17) for _ in range(200)])
+        for ratio in [0, 0.25, 0.5, 1]:
+            self.assertListEqual(
+                bulk.random_chance_many(ratio, 200).tolist(),
+                [int(single.random_chance(ratio)) for _ in range(200)],
+            )
+        self.assertEqual(bulk.seed, single.seed)
+
+    @number("6.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_shuffle_permutation(self):
+        # The permutation produced before bulk key draws were introduced.
+        stream = RandomStream(5)
+        positions = [(stream.random(), i) for i in range(20)]
+        positions.sort()
+        expected = [p[1] for p in positions]
+
+        collection = ArrayR.from_list(list(range(20)))
+        RandomStream(5).random_shuffle(collection)
+        self.assertListEqual(collection.to_list(), expected)
+
+    @number("6.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_fisher_yates_shuffle(self):
+        collection = ArrayR.from_list(list(range(20)))
+        shuffled = RandomStream(5)
+        shuffled.random_shuffle(collection, compatible=False)
+        self.assertListEqual(sorted(collection.to_list()), list(range(20)))
+        self.assertNotEqual(collection.to_list(), list(range(20)))
+
+        again = ArrayR.from_list(list(range(20)))
+        RandomStream(5).random_shuffle(again, compatible=False)
+        self.assertListEqual(again.to_list(), collection.to_list())
+
+        # The same swaps as drawing randint(0, i) for each i, from the back.
+        stream = RandomStream(5)
+        expected = list(range(20))
+        for i in range(19, 0, -1):
+            j = stream.randint(0, i)
+            expected[i], expected[j] = expected[j], expected[i]
+        self.assertListEqual(collection.to_list(), expected)
+        self.assertEqual(shuffled.seed, stream.seed)
+
+    @number("6.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_random_gen_seed(self):
+        RandomGen.set_seed(2023)
+        self.assertEqual(RandomGen.seed, 2023)
+        RandomGen.random()
+        self.assertEqual(RandomGen.seed, RandomGen.stream.seed)
+        RandomGen.seed = 77
+        self.assertEqual(RandomGen.random(), RandomStream(77).random())
@@ -1,3 +1,4 @@
+import math
 from unittest import TestCase
 
 from ed_utils.decorators import number, visibility
@@ -59,3 +60,23 @@ class TestStats(TestCase):
         self.assertEqual(cs.get_defense(1), 8)
         self.assertEqual(cs.get_speed(5), 250)
         self.assertEqual(cs.get_max_hp(41), 6)
+
+    @number("4.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_complex_stats_levels(self):
+        formula = ArrayR.from_list(["level", "2", "3", "+", "*", "1", "-"])
+        cs = ComplexStats(formula, formula, formula, ArrayR.from_list(["7"]))
+        for level in [1, 2, 1, 63, 64, 1000]:
+            self.assertEqual(cs.get_attack(level), level * 5 - 1)
+        self.assertEqual(cs.get_max_hp(3), 7)
+
+    @number("4.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_complex_stats_middle_floats(self):
+        sqrt_middle = ArrayR.from_list(["level", "sqrt", "1", "10", "middle"])
+        cs = ComplexStats(sqrt_middle, ArrayR.from_list(["0.1", "0.2", "0.3", "middle"]), sqrt_middle, sqrt_middle)
+        for level in range(1, 100):
+            self.assertEqual(cs.get_attack(level), min(max(math.sqrt(level), 1), 10))
+        self.assertEqual(cs.get_defense(1), 0.2)
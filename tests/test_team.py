@@ -8,6 +8,7 @@ from ed_utils.timeout import timeout
 from random_gen import RandomGen
 
 from team import MonsterTeam
+from elements import Element
 from helpers import Flamikin, Aquariuma, Vineon, Normake, Thundrake, Rockodile, Mystifly, Strikeon, Faeboa, Soundcobra
 
 from data_structures.referential_array import ArrayR
@@ -260,3 +261,40 @@ class TestTeam(TestCase):
 
         self.assertEqual(len(team), 1)
         self.assertIsInstance(team.retrieve_from_team(), Flamikin)
+
+    @number("3.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_initial_elements(self):
+        team = MonsterTeam(
+            team_mode=MonsterTeam.TeamMode.FRONT,
+            selection_mode=MonsterTeam.SelectionMode.PROVIDED,
+            provided_monsters=ArrayR.from_list([Flamikin, Aquariuma, Flamikin]),
+        )
+        self.assertListEqual(list(team.initial_elements), sorted([Element.FIRE.value, Element.WATER.value]))
+        # Battling and regenerating does not change what the team was selected with.
+        team.retrieve_from_team()
+        team.regenerate_team()
+        self.assertEqual(len(team.initial_elements), 2)
+
+    @number("3.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_optimise_special_ties(self):
+        def make_team():
+            return MonsterTeam(
+                team_mode=MonsterTeam.TeamMode.OPTIMISE,
+                selection_mode=MonsterTeam.SelectionMode.PROVIDED,
+                sort_key=MonsterTeam.SortMode.LEVEL,
+                provided_monsters=ArrayR.from_list([Flamikin, Aquariuma, Vineon, Thundrake]),
+            )
+        expected = make_team()
+        expected_order = [type(expected.retrieve_from_team()) for _ in range(4)]
+        # Every monster is level 1, so toggling the order keeps them as they were.
+        team = make_team()
+        team.special()
+        self.assertListEqual([type(team.retrieve_from_team()) for _ in range(4)], expected_order)
+        team = make_team()
+        team.special()
+        team.special()
+        self.assertListEqual([type(team.retrieve_from_team()) for _ in range(4)], expected_order)
@@ -0,0 +1,77 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+from random_gen import RandomGen, RandomStream
+
+from battle import Battle
+from team import MonsterTeam
+from tower import BattleTower
+from tower_runner import TowerRun, TowerRunner, derive_seeds
+from helpers import Flamikin, Faeboa, Vineon
+
+from data_structures.referential_array import ArrayR
+
+class TestTowerRunner(TestCase):
+
+    def make_runs(self) -> ArrayR[TowerRun]:
+        seeds = derive_seeds(123456789, 6)
+        runs = ArrayR(len(seeds))
+        for i in range(len(seeds)):
+            my_team = MonsterTeam(
+                team_mode=MonsterTeam.TeamMode.BACK,
+                selection_mode=MonsterTeam.SelectionMode.PROVIDED,
+                provided_monsters=ArrayR.from_list([Flamikin, Faeboa, Vineon][:i % 3 + 1]),
+            )
+            runs[i] = TowerRun(seeds[i], my_team, 3)
+        return runs
+
+    @number("5.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout(20)
+    def test_pool_matches_sequential(self):
+        sequential = TowerRunner(processes=1).run(self.make_runs())
+        pooled = TowerRunner(processes=2).run(self.make_runs())
+        self.assertEqual(len(pooled), len(sequential))
+        for i in range(len(sequential)):
+            self.assertListEqual(pooled[i].to_list(), sequential[i].to_list())
+
+    @number("5.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_run_matches_tower(self):
+        run = self.make_runs()[0]
+        log = TowerRunner(processes=1).run(ArrayR.from_list([run]))[0]
+
+        RandomGen.set_seed(run.seed)
+        bt = BattleTower(Battle(verbosity=0))
+        bt.set_my_team(run.my_team)
+        bt.generate_teams(run.n_teams)
+        expected = []
+        for result, _, _, my_lives, tower_lives in bt:
+            expected.append((result, my_lives, tower_lives))
+        self.assertListEqual(log.to_list(), expected)
+
+    @number("5.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_derive_seeds(self):
+        seeds = derive_seeds(123456789, 4)
+        streams = RandomStream(123456789).split(4)
+        for i in range(4):
+            self.assertEqual(seeds[i], streams[i].seed)
+        # Each run starts a whole substream after the previous one.
+        stream = RandomStream(seeds[0])
+        stream.jump(RandomStream.SPLIT_STRIDE)
+        self.assertEqual(stream.seed, seeds[1])
+
+    @number("5.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_sequential_leaves_state(self):
+        runs = self.make_runs()
+        RandomGen.set_seed(5)
+        TowerRunner(processes=1).run(runs)
+        self.assertEqual(RandomGen.seed, 5)
+        for i in range(len(runs)):
+            self.assertEqual(len(runs[i].my_team), i % 3 + 1)
@@ -7,6 +7,11 @@ from battle import Battle
 from elements import Element
 
 from data_structures.referential_array import ArrayR
+from data_structures.sorting import merge_sort
+from data_structures.sorted_list_adt import ListItem
+from data_structures.queue_adt import CircularQueue
+from data_structures.stack_adt import ArrayStack
+from data_structures.bset import BSet
 
 class BattleTower:
 
@@ -15,30 +20,117 @@ class BattleTower:
 
     def __init__(self, battle: Battle|None=None) -> None:
         self.battle = battle or Battle(verbosity=0)
+        self.my_team = None
+        self.my_lives = 0
+        # Tower teams waiting to battle, as ListItem(team, lives).
+        self.teams = CircularQueue(0)
+        # Elements of every team that has battled so far.
+        self.seen_elements = BSet()
+        # Elements of the teams in the upcoming battle. Recomputed whenever the front of the tower changes.
+        self.upcoming_elements = BSet()
 
     def set_my_team(self, team: MonsterTeam) -> None:
         # Generate the team lives here too.
-        raise NotImplementedError
+        self.my_team = team
+        self.my_lives = RandomGen.randint(self.MIN_LIVES, self.MAX_LIVES)
+        self._update_upcoming_elements()
 
     def generate_teams(self, n: int) -> None:
-        raise NotImplementedError
+        self.teams = CircularQueue(n)
+        for _ in range(n):
+            team = MonsterTeam(MonsterTeam.TeamMode.BACK, MonsterTeam.SelectionMode.RANDOM)
+            lives = RandomGen.randint(self.MIN_LIVES, self.MAX_LIVES)
+            self.teams.append(ListItem(team, lives))
+        self._update_upcoming_elements()
 
     def battles_remaining(self) -> bool:
-        raise NotImplementedError
+        return self.my_lives > 0 and not self.teams.is_empty()
 
     def next_battle(self) -> tuple[Battle.Result, MonsterTeam, MonsterTeam, int, int]:
-        raise NotImplementedError
+        if not self.battles_remaining():
+            raise ValueError("No battles remaining.")
+        entry = self.teams.serve()
+        tower_team = entry.value
+        self.my_team.regenerate_team()
+        tower_team.regenerate_team()
+        self.seen_elements |= self.my_team.initial_elements
+        self.seen_elements |= tower_team.initial_elements
+
+        result = self.battle.battle(self.my_team, tower_team)
+        if result == Battle.Result.TEAM1:
+            entry.key -= 1
+        elif result == Battle.Result.TEAM2:
+            self.my_lives -= 1
+        else:
+            entry.key -= 1
+            self.my_lives -= 1
+
+        if entry.key > 0:
+            self.teams.append(entry)
+        self._update_upcoming_elements()
+        return result, self.my_team, tower_team, self.my_lives, entry.key
+
+    def __iter__(self) -> BattleTower:
+        return self
+
+    def __next__(self) -> tuple[Battle.Result, MonsterTeam, MonsterTeam, int, int]:
+        if not self.battles_remaining():
+            raise StopIteration
+        return self.next_battle()
+
+    def _update_upcoming_elements(self) -> None:
+        """:complexity: O(1), the teams track their own elements."""
+        upcoming = 0
+        if self.my_team is not None:
+            upcoming |= self.my_team.initial_elements.elems
+        if not self.teams.is_empty():
+            upcoming |= self.teams.peek().value.initial_elements.elems
+        self.upcoming_elements = BSet.from_bits(upcoming)
 
     def out_of_meta(self) -> ArrayR[Element]:
-        raise NotImplementedError
+        """
+        Elements that were present in a previous battle, but are not present in the upcoming battle.
+        Returned in Element order.
+
+        :complexity: O(E) where E is the number of elements returned.
+        """
+        missing = self.seen_elements - self.upcoming_elements
+        res = ArrayR(len(missing))
+        for i, value in enumerate(missing):
+            res[i] = Element(value)
+        return res
 
     def sort_by_lives(self):
         # 1054 ONLY
-        raise NotImplementedError
+        ordered = ArrayR(len(self.teams))
+        for i in range(len(ordered)):
+            ordered[i] = self.teams.serve()
+        merge_sort(ordered, key=lambda item: item.key)
+        for i in range(len(ordered)):
+            self.teams.append(ordered[i])
+        self._update_upcoming_elements()
 
 def tournament_balanced(tournament_array: ArrayR[str]):
     # 1054 ONLY
-    raise NotImplementedError
+    """
+    Whether a tournament given in postfix notation is balanced,
+    that is every "+" combines two sub-tournaments of the same height.
+
+    :complexity: O(n) best/worst case, where n is the length of tournament_array.
+    """
+    heights = ArrayStack(len(tournament_array))
+    for i in range(len(tournament_array)):
+        if tournament_array[i] == "+":
+            if len(heights) < 2:
+                return False
+            right = heights.pop()
+            left = heights.pop()
+            if left != right:
+                return False
+            heights.push(left + 1)
+        else:
+            heights.push(0)
+    return len(heights) == 1
 
 if __name__ == "__main__":
 
@@ -0,0 +1,112 @@
+"""
+Runs many independent battle towers in parallel over a process pool.
+"""
+from __future__ import annotations
+import pickle
+from multiprocessing import Pool
+from typing import Optional
+
+from random_gen import RandomGen, RandomStream
+from team import MonsterTeam
+from battle import Battle
+from tower import BattleTower
+
+from data_structures.referential_array import ArrayR
+
+
+class TowerRun:
+    """
+    A single battle tower to simulate.
+
+    The tower seeds RandomGen with `seed` right before it draws the player's lives,
+    so a run gives the same battles no matter which worker process it lands on.
+    """
+
+    def __init__(self, seed: int, my_team: MonsterTeam, n_teams: int) -> None:
+        self.seed = seed
+        self.my_team = my_team
+        self.n_teams = n_teams
+
+
+def run_tower(run: TowerRun) -> ArrayR[tuple[Battle.Result, int, int]]:
+    """
+    Plays out a whole tower, returning (result, player lives, tower team lives) for every battle.
+
+    :complexity: O(B * C) where B is the number of battles and C the cost of a battle.
+    """
+    RandomGen.set_seed(run.seed)
+    tower = BattleTower(Battle(verbosity=0))
+    tower.set_my_team(run.my_team)
+    tower.generate_teams(run.n_teams)
+
+    # Every battle costs someone a life, which bounds the number of battles.
+    log = ArrayR(BattleTower.MAX_LIVES * (run.n_teams + 1))
+    n_battles = 0
+    while tower.battles_remaining():
+        result, _, _, my_lives, tower_lives = tower.next_battle()
+        log[n_battles] = (result, my_lives, tower_lives)
+        n_battles += 1
+
+    res = ArrayR(n_battles)
+    for i in range(n_battles):
+        res[i] = log[i]
+    return res
+
+
+def derive_seeds(seed: int, n: int) -> ArrayR[int]:
+    """
+    n seeds for independent runs: the starting states of `RandomStream(seed).split(n)`.
+
+    Each run therefore draws from its own substream, which cannot overlap another run's
+    unless a run makes more than RandomStream.SPLIT_STRIDE draws.
+    :complexity: O(n + log(n * RandomStream.SPLIT_STRIDE))
+    """
+    streams = RandomStream(seed).split(n)
+    seeds = ArrayR(n)
+    for i in range(n):
+        seeds[i] = streams[i].seed
+    return seeds
+
+
+class TowerRunner:
+    """
+    Spreads many BattleTower runs over a multiprocessing pool.
+
+    Results are merged back in the same order as the runs were given.
+
+    Usage:
+    ```
+    seeds = derive_seeds(123, 64)
+    runs = ArrayR(64)
+    for i in range(64):
+        runs[i] = TowerRun(seeds[i], my_team, 3)
+    logs = TowerRunner().run(runs)   # logs[i] is the battle log of runs[i]
+    ```
+    """
+
+    def __init__(self, processes: Optional[int] = None) -> None:
+        """
+        :processes: Number of worker processes. Defaults to the number of CPUs.
+            With a single process, runs are simulated in this process without a pool.
+        """
+        self.processes = processes
+
+    def run(self, runs: ArrayR[TowerRun]) -> ArrayR[ArrayR[tuple[Battle.Result, int, int]]]:
+        """
+        The battle log of every run, in order.
+
+        Either way, the given runs and their teams are left untouched, and so is RandomGen.
+        """
+        if self.processes == 1:
+            # Like the workers, play copies of the runs, and leave the shared stream as it was.
+            saved_seed = RandomGen.seed
+            try:
+                logs = ArrayR(len(runs))
+                for i in range(len(runs)):
+                    logs[i] = run_tower(pickle.loads(pickle.dumps(runs[i])))
+            finally:
+                RandomGen.seed = saved_seed
+            return logs
+        with Pool(self.processes) as pool:
+            # Pool.map keeps the results in the order of the runs given.
+            return ArrayR.from_list(pool.map(run_tower, runs.to_list()))